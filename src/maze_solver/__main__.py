@@ -3,21 +3,18 @@
 import struct
 import argparse
 import pathlib
+import sys
 import webbrowser
-from typing import List
-import time
-from pathlib import Path
+from typing import List, Optional, Tuple
 
 from maze_solver.view.renderer import SVGRenderer
-from maze_solver_wrapper import solve_maze, generate_html, generate_html_animation, SquareC
-from maze_solver.graphs.solver import (
-    animate_solution, bfs, dead_end_filling, dfs, dijkstra, greedy_best_first,
-    wall_follower, recursive_backtracking, a_star_search_steps,
-    tremaux_algorithm, bellman_ford_algorithm, lee_algorithm, genetic_algorithm,
-    ant_colony_optimization, best_first_graph_search,
-    wavefront_expansion, jump_point_search, fringe_search, iddfs
-)
+from maze_solver.graphs.converter import solve_contracted
+from maze_solver.graphs.pruning import prune_dead_ends
+from maze_solver.graphs.registry import get_solver, select_solver, solver_names
+from maze_solver.graphs.solver import animate_solution
+from maze_solver.graphs.weights import DEFAULT_BONUS, DEFAULT_PENALTY, role_cost, weighted_maze
 from maze_solver.models.maze import Maze
+from maze_solver.race import DEFAULT_ENTRANTS, race
 from maze_solver.models.square import Square
 from maze_solver.models.role import Role
 from maze_solver.models.border import Border
@@ -27,20 +24,36 @@ def main() -> None:
     if args.use_cpp:
         solve_maze_cpp_wrapper(args.path, args.algorithm, args.animation, args.delay, args.direction, args.output_dir)
     else:
-        solve_maze_python_wrapper(args.path, args.output_dir, args.algorithm, args.animation, args.delay, args.direction)
+        solve_maze_python_wrapper(args.path, args.output_dir, args.algorithm, args.animation, args.delay, args.direction, contract=args.contract, race_entrants=args.race, optimal=args.optimal, weights=(args.reward_bonus, args.enemy_penalty) if args.weighted else None, prune=args.prune, frames=args.frames)
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("path", type=pathlib.Path, help="Path to the maze file")
-    parser.add_argument("--algorithm", choices=["bfs", "a-star", "dfs", "dijkstra", "greedy", "wall-follower", "dead-end", "recursive-bt", "tremaux", "bellman-ford", "lee", "genetic", "ant-colony", "best-first", "wavefront", "jump-point", "fringe", "iddfs"], default="bfs", help="Algorithm to use")
+    parser.add_argument("--algorithm", choices=["auto", *solver_names()], default="bfs", help="Algorithm to use (auto picks the cheapest optimal solver)")
     parser.add_argument("--animation", action="store_true", help="Show an animated solution")
     parser.add_argument("--delay", type=float, default=0.5, help="Delay between animation steps (in seconds)")
+    parser.add_argument("--frames", action="store_true", help="With --animation, render every step as a full frame instead of revealing the path over one drawing")
     parser.add_argument("--direction", choices=["top-down", "bottom-up"], default="top-down", help="Direction of the solution animation")
+    parser.add_argument("--contract", action="store_true", help="Search the junction graph instead of every square")
+    parser.add_argument("--race", nargs="*", choices=solver_names(), metavar="ALGORITHM", help=f"Race several algorithms in parallel and keep the first answer (default: {' '.join(DEFAULT_ENTRANTS)})")
+    parser.add_argument("--optimal", action="store_true", help="With --race, only accept answers from optimal solvers")
+    parser.add_argument("--prune", action="store_true", help="Fill dead ends before solving, leaving only squares that can be on a path")
+    parser.add_argument("--weighted", action="store_true", help="Charge extra for stepping onto enemies and less for rewards")
+    parser.add_argument("--reward-bonus", type=int, default=DEFAULT_BONUS, help="With --weighted, cost taken off a step onto a reward")
+    parser.add_argument("--enemy-penalty", type=int, default=DEFAULT_PENALTY, help="With --weighted, cost added to a step onto an enemy")
     parser.add_argument("--use_cpp", action="store_true", help="Use C++ solver instead of Python solver")
     parser.add_argument("--output_dir", type=pathlib.Path, help="Directory to save the output files", default=pathlib.Path("./output"))
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.weighted and (args.contract or args.race is not None):
+        parser.error("--weighted can't be combined with --contract or --race")
+    if args.contract and args.race is not None:
+        parser.error("--contract can't be combined with --race")
+    return args
 
 def solve_maze_cpp_wrapper(path, algorithm, animation, delay, direction, output_dir):
+    # Loading the C++ library is slow and platform specific, so only do it when asked to.
+    from maze_solver_wrapper import solve_maze, generate_html, generate_html_animation, SquareC
+
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -83,7 +96,7 @@ def solve_maze_cpp_wrapper(path, algorithm, animation, delay, direction, output_
     # Open the HTML file in the browser
     webbrowser.open(f"file://{html_file_path.resolve()}")
 
-def solve_maze_python_wrapper(maze_path: pathlib.Path, output_dir: pathlib.Path, algorithm: str, animation: bool, delay: float, direction: str, test = False) -> None:
+def solve_maze_python_wrapper(maze_path: pathlib.Path, output_dir: pathlib.Path, algorithm: str, animation: bool, delay: float, direction: str, test = False, contract: bool = False, race_entrants: Optional[List[str]] = None, optimal: bool = False, weights: Optional[Tuple[int, int]] = None, prune: bool = False, frames: bool = False) -> None:
     # Create output directory if it doesn't exist
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -91,49 +104,41 @@ def solve_maze_python_wrapper(maze_path: pathlib.Path, output_dir: pathlib.Path,
     print(f"Loaded maze with dimensions: {maze.width}x{maze.height}")
     print(f"Number of squares: {len(maze.squares)}")
 
-    if algorithm == "bfs":
-        solution_steps = bfs(maze, maze.entrance, maze.exit)
-    elif algorithm == "dfs":
-        solution_steps = dfs(maze, maze.entrance, maze.exit)
-    elif algorithm == "dijkstra":
-        solution_steps = dijkstra(maze, maze.entrance, maze.exit)
-    elif algorithm == "greedy":
-        solution_steps = greedy_best_first(maze, maze.entrance, maze.exit)
-    elif algorithm == "wall-follower":
-        solution_steps = wall_follower(maze, maze.entrance, maze.exit)
-    elif algorithm == "dead-end":
-        solution_steps = dead_end_filling(maze, maze.entrance, maze.exit)
-    elif algorithm == "recursive-bt":
-        solution_steps = recursive_backtracking(maze, maze.entrance, maze.exit)
-    elif algorithm == "a-star":
-        solution_steps = a_star_search_steps(maze, maze.entrance, maze.exit)
-    elif algorithm == "tremaux":
-        solution_steps = tremaux_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "bellman-ford":
-        solution_steps = bellman_ford_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "lee":
-        solution_steps = lee_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "genetic":
-        solution_steps = genetic_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "ant-colony":
-        solution_steps = ant_colony_optimization(maze, maze.entrance, maze.exit)
-    elif algorithm == "best-first":
-        solution_steps = best_first_graph_search(maze, maze.entrance, maze.exit)
-    elif algorithm == "wavefront":
-        solution_steps = wavefront_expansion(maze, maze.entrance, maze.exit)
-    elif algorithm == "jump-point":
-        solution_steps = jump_point_search(maze, maze.entrance, maze.exit)
-    elif algorithm == "fringe":
-        solution_steps = fringe_search(maze, maze.entrance, maze.exit)
-    elif algorithm == "iddfs":
-        solution_steps = iddfs(maze, maze.entrance, maze.exit)
+    # Solvers see the pruned maze; the original is still what gets drawn.
+    searched = prune_dead_ends(maze) if prune else maze
+    start, goal = searched.entrance, searched.exit
+    weighted = contract or weights is not None
+    # A bonus above 1 makes reward steps cost less than nothing.
+    negative_costs = weights is not None and role_cost(Role.REWARD, *weights) < 0
+    solver = (
+        select_solver(searched, weighted=weighted, negative_costs=negative_costs)
+        if algorithm == "auto" else get_solver(algorithm)
+    )
+    if weights is not None and not solver.weighted:
+        print(f"Warning: {solver.name} ignores step costs")
+        weights = None
+    elif negative_costs and not solver.negative_costs:
+        sys.exit(f"{solver.name}: negative step costs (--reward-bonus above 1) need bellman-ford")
+    if race_entrants is not None:
+        entrants = [get_solver(name) for name in race_entrants or DEFAULT_ENTRANTS]
+        solver, solution_steps = race(searched, start, goal, entrants, optimal)
+        if solver is not None:
+            print(f"Fastest solver: {solver.name}")
+    elif contract:
+        solution_steps = solve_contracted(searched, start, goal, solver)
+    elif weights is not None:
+        try:
+            solution_steps = solver(weighted_maze(searched, *weights), start, goal)
+        except ValueError as error:
+            # A large reward bonus makes negative costs (dial) or negative cycles (bellman-ford).
+            sys.exit(f"{solver.name}: {error}")
     else:
-        raise ValueError(f"Unsupported algorithm: {algorithm}")
+        solution_steps = solver(searched, start, goal)
 
     if solution_steps and not test:
         renderer = SVGRenderer()
         if animation:
-            animate_solution(maze, solution_steps, delay, direction)
+            animate_solution(maze, solution_steps, delay, direction, frames)
         else:
             # Render the final step to get the complete solution
             final_solution_step = solution_steps[-(len(solution_steps) - 1)]
@@ -166,36 +171,5 @@ def solve_maze_python_wrapper(maze_path: pathlib.Path, output_dir: pathlib.Path,
 def decompress(square_value: int) -> tuple[Border, Role]:
     return Border(square_value & 0xf), Role(square_value >> 4)
 
-def time_algorithms(maze_path: Path, output_dir: Path, animation: bool, delay: float, direction: str) -> None:
-    algorithms = [
-        "bfs", "a-star", "dfs", "dijkstra", "greedy", "wall-follower", 
-        "dead-end", "tremaux", "lee", 
-        "best-first", "wavefront", "jump-point", 
-        "fringe"]
-    
-    results = []
-    
-    for algorithm in algorithms:
-        start_time = time.time()
-        try:
-            print(f"Timing {algorithm} algorithm")
-            solve_maze_python_wrapper(maze_path, output_dir, algorithm, animation, delay, direction, True)
-            elapsed_time = time.time() - start_time
-            print(f"{algorithm}: {elapsed_time:.2f} seconds")
-            results.append((algorithm, elapsed_time))
-        except Exception as e:
-            results.append((algorithm, float('inf')))  # Use inf to indicate failure
-            print(f"{algorithm}: Failed with error: {e}")
-
-    # Sort results by elapsed time
-    results.sort(key=lambda x: x[1])
-
-    # Print sorted results
-    for algorithm, elapsed_time in results:
-        if elapsed_time == float('inf'):
-            print(f"{algorithm}: Failed")
-        else:
-            print(f"{algorithm}: {elapsed_time:.2f} seconds")
-
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,128 @@
+# batch.py
+import argparse
+import glob
+import json
+import os
+import pathlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Iterator, List, Optional, Sequence
+
+from maze_solver.bench import quietly
+from maze_solver.graphs.registry import get_solver, select_solver, solver_names
+from maze_solver.graphs.solver import SearchStats
+from maze_solver.models.maze import Maze
+
+@dataclass(frozen=True)
+class BatchResult:
+    path: str
+    algorithm: str
+    solved: bool
+    path_length: int
+    nodes_expanded: Optional[int]  # None for solvers that don't report SearchStats
+    load_seconds: float
+    solve_seconds: float
+    error: Optional[str] = None
+
+def main() -> None:
+    args = parse_args()
+    paths = find_mazes(args.paths)
+    if not paths:
+        sys.exit("No maze files found")
+
+    output = args.output.open("w") if args.output else sys.stdout
+    solved = 0
+    try:
+        for result in solve_batch(paths, args.algorithm, args.workers, args.chunksize, args.render):
+            output.write(json.dumps(asdict(result)) + "\n")
+            output.flush()
+            solved += result.solved
+    finally:
+        if args.output:
+            output.close()
+    print(f"Solved {solved} of {len(paths)} mazes", file=sys.stderr)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Solve many maze files in parallel")
+    parser.add_argument("paths", nargs="+", help="Maze files, directories or glob patterns")
+    parser.add_argument("--algorithm", choices=["auto", *solver_names()], default="bfs", help="Algorithm to use (auto picks per maze)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--chunksize", type=int, default=16, help="Mazes handed to a worker at a time")
+    parser.add_argument("--output", type=pathlib.Path, help="JSON-lines file for the results (defaults to stdout)")
+    parser.add_argument("--render", type=pathlib.Path, help="Also write an SVG of each solution into this directory")
+    return parser.parse_args()
+
+def find_mazes(patterns: Sequence[str]) -> List[pathlib.Path]:
+    paths: List[pathlib.Path] = []
+    for pattern in patterns:
+        path = pathlib.Path(pattern)
+        if path.is_dir():
+            paths.extend(sorted(path.rglob("*.maze")))
+        elif path.is_file():
+            paths.append(path)
+        else:
+            paths.extend(pathlib.Path(match) for match in sorted(glob.glob(pattern, recursive=True)))
+    return paths
+
+def solve_batch(
+    paths: Sequence[pathlib.Path],
+    algorithm: str = "bfs",
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+    render: Optional[pathlib.Path] = None,
+) -> Iterator[BatchResult]:
+    """Solve maze files across a process pool, yielding results as chunks finish.
+
+    Rendered solutions are named after the file and its position in
+    `paths`, so files with the same name in different directories don't
+    overwrite each other.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(solve_files, paths[first:first + chunksize], algorithm, render, first)
+            for first in range(0, len(paths), chunksize)
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+def solve_files(
+    paths: Sequence[pathlib.Path], algorithm: str, render: Optional[pathlib.Path] = None, first: int = 0
+) -> List[BatchResult]:
+    return [solve_file(path, algorithm, render, first + offset) for offset, path in enumerate(paths)]
+
+def solve_file(
+    path: pathlib.Path, algorithm: str, render: Optional[pathlib.Path] = None, position: int = 0
+) -> BatchResult:
+    try:
+        start_time = time.perf_counter()
+        maze = quietly(Maze.load, path)
+        load_seconds = time.perf_counter() - start_time
+
+        solver = select_solver(maze) if algorithm == "auto" else get_solver(algorithm)
+        stats = SearchStats() if solver.reports_stats else None
+        start_time = time.perf_counter()
+        solution_steps = solver(maze, maze.entrance, maze.exit, stats)
+        solve_seconds = time.perf_counter() - start_time
+    except Exception as error:
+        return BatchResult(str(path), algorithm, False, 0, None, 0.0, 0.0, error=f"{type(error).__name__}: {error}")
+
+    if solution_steps and render is not None:
+        from maze_solver.view.renderer import SVGRenderer
+        render.mkdir(parents=True, exist_ok=True)
+        svg = SVGRenderer().render(maze, solution_steps[0])
+        (render / f"{position}-{path.stem}.svg").write_text(svg.xml_content)
+
+    return BatchResult(
+        path=str(path),
+        algorithm=solver.name,
+        solved=bool(solution_steps),
+        path_length=len(solution_steps[0]) if solution_steps else 0,
+        nodes_expanded=stats.expanded if stats is not None else None,
+        load_seconds=load_seconds,
+        solve_seconds=solve_seconds,
+    )
+
+if __name__ == "__main__":
+    main()
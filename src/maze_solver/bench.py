@@ -0,0 +1,189 @@
+# bench.py
+import argparse
+import contextlib
+import csv
+import io
+import json
+import pathlib
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterator, Optional, Sequence, Tuple
+
+from maze_solver.generators import GENERATORS
+from maze_solver.graphs import distance
+from maze_solver.graphs.adjacency import Adjacency
+from maze_solver.graphs.registry import Complexity, SolverInfo, eligible_solvers, get_solver
+from maze_solver.graphs.solver import SearchStats
+from maze_solver.models.maze import Maze
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    generator: str
+    width: int
+    height: int
+    seed: int
+    algorithm: str
+    repeats: int
+    load_seconds: float
+    index_seconds: float
+    solve_min_seconds: float
+    solve_median_seconds: float
+    solve_mean_seconds: float
+    solved: bool
+    path_length: int
+    nodes_expanded: Optional[int]  # None for solvers that don't report SearchStats
+    heap_pushes: Optional[int]
+    list_pushes: Optional[int]  # Pushes onto plain lists or buckets instead of a heap
+    peak_memory_bytes: int
+
+def main() -> None:
+    args = parse_args()
+    solvers = (
+        [get_solver(name) for name in args.algorithms]
+        if args.algorithms
+        else eligible_solvers(max_complexity=Complexity.LINEARITHMIC)
+    )
+    results = []
+    for result in run_benchmarks(args.generators, args.sizes, solvers, args.seed, args.repeats, args.warmup):
+        print(
+            f"{result.generator:>8} {result.width}x{result.height} {result.algorithm:>14}: "
+            f"solve {result.solve_median_seconds * 1000:.2f} ms, "
+            f"expanded {format_count(result.nodes_expanded)}, "
+            f"pushes {format_count(result.heap_pushes)} heap / {format_count(result.list_pushes)} list, "
+            f"peak {result.peak_memory_bytes / 1024:.0f} KiB"
+        )
+        results.append(result)
+    if args.output:
+        write_results(results, args.output)
+        print(f"Results written to {args.output}")
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark maze solvers")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[(50, 50), (100, 100)], help="Maze sizes as WIDTHxHEIGHT")
+    parser.add_argument("--generators", choices=list(GENERATORS), nargs="+", default=["dfs"], help="Maze generators to use")
+    parser.add_argument("--algorithms", nargs="+", help="Algorithms to time (defaults to every solver that is at most O(E log V))")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for maze generation")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per solver")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per solver before timing")
+    parser.add_argument("--output", type=pathlib.Path, help="Write results to a .json or .csv file")
+    return parser.parse_args()
+
+def parse_size(text: str) -> Tuple[int, int]:
+    try:
+        width, height = map(int, text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size: {text}") from None
+    return width, height
+
+def run_benchmarks(
+    generators: Sequence[str],
+    sizes: Sequence[Tuple[int, int]],
+    solvers: Sequence[SolverInfo],
+    seed: int = 0,
+    repeats: int = 5,
+    warmup: int = 1,
+) -> Iterator[BenchmarkResult]:
+    with tempfile.TemporaryDirectory() as directory:
+        for generator in generators:
+            for width, height in sizes:
+                random.seed(seed)
+                path = pathlib.Path(directory) / f"{generator}-{width}x{height}.maze"
+                GENERATORS[generator](width, height).dump(path)
+
+                load_seconds, maze = timed(lambda: quietly(Maze.load, path))
+                index_seconds, _ = timed(lambda: Adjacency.build(maze.width, maze.height, maze.square_values))
+                maze.adjacency  # Build the shared index once, outside of the solve timings.
+
+                for solver in solvers:
+                    yield benchmark_solver(
+                        solver, maze, generator, seed, repeats, warmup, load_seconds, index_seconds
+                    )
+
+def benchmark_solver(
+    solver: SolverInfo,
+    maze: Maze,
+    generator: str,
+    seed: int,
+    repeats: int,
+    warmup: int,
+    load_seconds: float,
+    index_seconds: float,
+) -> BenchmarkResult:
+    start, goal = maze.entrance, maze.exit
+    for _ in range(warmup):
+        solver(maze, start, goal)
+    timings = []
+    for _ in range(repeats):
+        clear_search_caches(maze)
+        timings.append(timed(lambda: solver(maze, start, goal))[0])
+
+    # Counting and memory tracing slow the solver down, so they get a
+    # separate, untimed run.
+    stats = SearchStats() if solver.reports_stats else None
+    clear_search_caches(maze)
+    tracemalloc.start()
+    try:
+        steps = solver(maze, start, goal, stats)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        generator=generator,
+        width=maze.width,
+        height=maze.height,
+        seed=seed,
+        algorithm=solver.name,
+        repeats=repeats,
+        load_seconds=load_seconds,
+        index_seconds=index_seconds,
+        solve_min_seconds=min(timings, default=0.0),
+        solve_median_seconds=statistics.median(timings) if timings else 0.0,
+        solve_mean_seconds=statistics.fmean(timings) if timings else 0.0,
+        solved=bool(steps),
+        path_length=len(steps[0]) if steps else 0,
+        nodes_expanded=stats.expanded if stats is not None else None,
+        heap_pushes=stats.heap_pushes if stats is not None else None,
+        list_pushes=stats.list_pushes if stats is not None else None,
+        peak_memory_bytes=peak,
+    )
+
+def format_count(count: Optional[int]) -> str:
+    return "n/a" if count is None else str(count)
+
+def clear_search_caches(maze: Maze) -> None:
+    """Drop the structures solvers cache per maze, so every run pays to build them.
+
+    Otherwise hpa and distance-field would only be timed looking up what
+    the warmup built. The shared adjacency index stays; it is timed on
+    its own as index_seconds.
+    """
+    for name in ("junction_graph", "cluster_graph"):
+        maze.__dict__.pop(name, None)  # Built by functools.cached_property
+    distance.clear_cache()
+
+def timed(function: Callable[[], object]) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def quietly(function: Callable, *args) -> object:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args)
+
+def write_results(results: Sequence[BenchmarkResult], path: pathlib.Path) -> None:
+    rows = [asdict(result) for result in results]
+    if path.suffix == ".csv":
+        with path.open("w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(BenchmarkResult.__dataclass_fields__))
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        path.write_text(json.dumps(rows, indent=2))
+
+if __name__ == "__main__":
+    main()
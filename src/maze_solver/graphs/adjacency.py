@@ -0,0 +1,142 @@
+# adjacency.py
+import array
+import mmap
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Sequence, Tuple
+
+from maze_solver.models.border import Border
+
+# Open sides of a square, i.e. the complement of its border nibble.
+OPEN_SIDES = bytes(~square_value & 0xf for square_value in range(256))
+
+DIRECTIONS = (Border.TOP, Border.RIGHT, Border.BOTTOM, Border.LEFT)
+
+OPPOSITE = {
+    Border.TOP: Border.BOTTOM,
+    Border.RIGHT: Border.LEFT,
+    Border.BOTTOM: Border.TOP,
+    Border.LEFT: Border.RIGHT,
+}
+
+DECODED = 0x10
+
+@dataclass(frozen=True)
+class Adjacency:
+    """Open-direction mask per square, using the same bits as Border.
+
+    A bit is set when neither side of the shared edge has a border and
+    the neighbor lies inside the maze, which matches the old per-call
+    checks done by get_neighbors().
+    """
+    width: int
+    height: int
+    open_directions: array.array
+
+    # Least cost of a single step. Heuristics scale Manhattan distance by
+    # it so they never overestimate.
+    min_cost = 1
+
+    @classmethod
+    def build(cls, width: int, height: int, square_values: Sequence[int]) -> "Adjacency":
+        size = width * height
+        if size == 0:
+            return cls(width, height, array.array("B"))
+
+        # Treat the whole grid as one big integer with a byte per square,
+        # so that shifting by 8 bits moves to the next column and shifting
+        # by 8 * width moves to the next row. Each pass is a single C loop.
+        own = int.from_bytes(bytes(square_values).translate(OPEN_SIDES), "little")
+        row_bits = 8 * width
+
+        def repeat(pattern: bytes) -> int:
+            return int.from_bytes(pattern * (size // len(pattern)), "little")
+
+        top = (own << row_bits) >> 2 & repeat(bytes([Border.TOP]))
+        bottom = (own >> row_bits) << 2 & repeat(bytes([Border.BOTTOM]))
+        right = (own >> 8) >> 2 & repeat(bytes([Border.RIGHT]) * (width - 1) + b"\x00")
+        left = (own << 8) << 2 & repeat(b"\x00" + bytes([Border.LEFT]) * (width - 1))
+
+        masks = own & (top | right | bottom | left)
+        return cls(width, height, array.array("B", masks.to_bytes(size, "little")))
+
+    @cached_property
+    def offsets(self) -> Tuple[Tuple[int, ...], ...]:
+        return direction_offsets(self.width)
+
+    def mask(self, index: int) -> int:
+        return self.open_directions[index]
+
+    def neighbors(self, index: int) -> List[int]:
+        return [index + delta for delta in self.offsets[self.open_directions[index]]]
+
+    def cost(self, source: int, target: int) -> int:
+        return 1
+
+class LazyAdjacency:
+    """Adjacency for memory-mapped mazes that decodes masks on first use.
+
+    Only the squares a search expands, and their direct neighbors, are
+    ever read, so a solve touches just the pages it visits.
+    """
+
+    min_cost = 1
+
+    def __init__(self, width: int, height: int, square_values: Sequence[int]) -> None:
+        self.width = width
+        self.height = height
+        self.square_values = square_values
+        self.offsets = direction_offsets(width)
+        # Zero means "not decoded yet"; decoded masks carry an extra bit.
+        # An anonymous map reads as zeros and only gets memory for the
+        # pages written to, unlike a bytearray, which is zero-filled up front.
+        self._masks = mmap.mmap(-1, max(width * height, 1))
+
+    @cached_property
+    def open_directions(self) -> array.array:
+        return Adjacency.build(self.width, self.height, self.square_values).open_directions
+
+    def mask(self, index: int) -> int:
+        mask = self._masks[index]
+        if not mask:
+            mask = self._decode(index) | DECODED
+            self._masks[index] = mask
+        return mask & 0xf
+
+    def neighbors(self, index: int) -> List[int]:
+        return [index + delta for delta in self.offsets[self.mask(index)]]
+
+    def cost(self, source: int, target: int) -> int:
+        return 1
+
+    def _decode(self, index: int) -> int:
+        square_values = self.square_values
+        row, column = divmod(index, self.width)
+        own = OPEN_SIDES[square_values[index]]
+        mask = 0
+        if row > 0 and OPEN_SIDES[square_values[index - self.width]] & Border.BOTTOM:
+            mask |= Border.TOP
+        if column < self.width - 1 and OPEN_SIDES[square_values[index + 1]] & Border.LEFT:
+            mask |= Border.RIGHT
+        if row < self.height - 1 and OPEN_SIDES[square_values[index + self.width]] & Border.TOP:
+            mask |= Border.BOTTOM
+        if column > 0 and OPEN_SIDES[square_values[index - 1]] & Border.RIGHT:
+            mask |= Border.LEFT
+        return own & mask
+
+def direction_deltas(width: int) -> Dict[Border, int]:
+    """Index delta of a single step in each direction."""
+    return {
+        Border.TOP: -width,
+        Border.RIGHT: 1,
+        Border.BOTTOM: width,
+        Border.LEFT: -1,
+    }
+
+def direction_offsets(width: int) -> Tuple[Tuple[int, ...], ...]:
+    """Index deltas of the open neighbors for each of the 16 masks."""
+    deltas = direction_deltas(width)
+    return tuple(
+        tuple(deltas[direction] for direction in DIRECTIONS if mask & direction)
+        for mask in range(16)
+    )
@@ -0,0 +1,163 @@
+# colony.py
+import array
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from maze_solver.graphs.adjacency import DIRECTIONS, direction_deltas
+from maze_solver.graphs.genetic import STEP_CAP, Walks, out_of_reach
+from maze_solver.models.maze import Maze
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ANTS = 100
+ITERATIONS = 10
+DECAY = 0.1
+
+@dataclass(frozen=True)
+class ColonyTables:
+    """What an ant needs to walk the maze, as arrays indexed by square."""
+    size: int
+    start: int
+    goal: int
+    masks: "np.ndarray"   # Open directions of each square
+    opened: "np.ndarray"  # Whether each direction of a mask is open, in DIRECTIONS order
+    deltas: "np.ndarray"  # Index delta of each direction
+
+    @classmethod
+    def build(cls, maze: Maze, start: int, goal: int) -> "ColonyTables":
+        import numpy as np
+        opened = np.array([[bool(mask & direction) for direction in DIRECTIONS] for mask in range(16)])
+        deltas = direction_deltas(maze.width)
+        masks = np.frombuffer(bytes(maze.adjacency.open_directions), dtype=np.uint8)
+        return cls(
+            len(masks), start, goal, masks, opened,
+            np.array([deltas[direction] for direction in DIRECTIONS], dtype=np.int64),
+        )
+
+    def march(
+        self, pheromones: "np.ndarray", ants: int, max_steps: int, rng: "np.random.Generator"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Walk a batch of ants at once, each for at most max_steps moves.
+
+        Every move picks a direction to a square the ant hasn't visited,
+        with probability proportional to its pheromone; an ant with none
+        retreats a square, as described in genetic.Walks. Returns the
+        (square * 4 + direction) edges of each ant's path from the start,
+        and the length of that path for ants that reached the goal (-1
+        for ants that never did).
+        """
+        import numpy as np
+        trails = pheromones.reshape(-1, len(DIRECTIONS))
+        walks = Walks(ants, self.size, self.start, max_steps)
+        lengths = np.full(ants, 0 if self.start == self.goal else -1, dtype=np.int64)
+        walking = np.flatnonzero(lengths < 0)
+        for _ in range(max_steps):
+            if not len(walking):
+                break
+            targets, free = walks.options(walking, self.masks, self.opened, self.deltas)
+            totals = np.cumsum(trails[walks.positions[walking]] * free, axis=1)
+            draws = rng.random(len(walking)) * totals[:, -1]
+            choices = (totals <= draws[:, None]).sum(axis=1)
+            walks.move(walking, targets, free, choices)
+            arrived = walks.positions[walking] == self.goal
+            # Ants that retreat past the start have walked the whole of
+            # their part of the maze without finding the goal.
+            done = arrived | (walks.depths[walking] < 0)
+            if done.any():
+                lengths[walking[arrived]] = walks.depths[walking[arrived]]
+                walking = walking[~done]
+        squares = walks.path.reshape(ants, max_steps + 1)
+        directions = walks.directions.reshape(ants, max_steps + 1)
+        return squares[:, :-1] * len(DIRECTIONS) + directions[:, 1:], lengths
+
+_tables: Optional[ColonyTables] = None
+_memory: Optional[shared_memory.SharedMemory] = None
+
+def _init_worker(tables: ColonyTables, memory_name: str) -> None:
+    global _tables, _memory
+    _tables = tables
+    _memory = shared_memory.SharedMemory(name=memory_name)
+
+def _worker_march(ants: int, max_steps: int, seed: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    import numpy as np
+    pheromones = np.ndarray((len(_tables.masks) * len(DIRECTIONS),), dtype=np.float64, buffer=_memory.buf)
+    return _tables.march(pheromones, ants, max_steps, np.random.default_rng(seed))
+
+def ant_colony(
+    maze: Maze,
+    start: int,
+    goal: int,
+    ants: int = ANTS,
+    iterations: int = ITERATIONS,
+    decay: float = DECAY,
+    max_steps: Optional[int] = None,
+    workers: int = 1,
+    seed: Optional[int] = None,
+) -> Optional[array.array]:
+    """Ant colony optimization over a flat (square, direction) pheromone array.
+
+    Each iteration walks all ants as one batch (or one batch per worker
+    process), has every ant that reached the goal lay 1 / its length on
+    the edges of its path, then evaporates the whole array by `decay`.
+    With workers > 1 the pheromones live in shared memory, so the
+    processes read them in place. Returns the shortest path found, goal
+    first, or None if no ant reached the goal within max_steps, which
+    defaults to four moves per square up to STEP_CAP. A goal further
+    than max_steps from the start is answered None without walking.
+    """
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    if max_steps is None:
+        max_steps = min(4 * maze.width * maze.height, STEP_CAP)
+    if out_of_reach(maze.width, start, goal, max_steps):
+        return None
+    tables = ColonyTables.build(maze, start, goal)
+    size = len(tables.masks) * len(DIRECTIONS)
+    best: Optional[List[int]] = None
+
+    with contextlib.ExitStack() as stack:
+        if workers > 1:
+            memory = shared_memory.SharedMemory(create=True, size=size * 8)
+            stack.callback(memory.unlink)
+            stack.callback(memory.close)
+            executor = stack.enter_context(ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(tables, memory.name)
+            ))
+            pheromones = np.ndarray((size,), dtype=np.float64, buffer=memory.buf)
+        else:
+            pheromones = np.empty(size, dtype=np.float64)
+        pheromones.fill(1.0)
+        try:
+            for _ in range(iterations):
+                if workers > 1:
+                    batches = [len(batch) for batch in np.array_split(np.arange(ants), workers)]
+                    seeds = rng.integers(0, 2 ** 63, len(batches)).tolist()
+                    marches = list(executor.map(_worker_march, batches, [max_steps] * len(batches), seeds))
+                    edges = np.concatenate([march[0] for march in marches])
+                    lengths = np.concatenate([march[1] for march in marches])
+                else:
+                    edges, lengths = tables.march(pheromones, ants, max_steps, rng)
+
+                arrived = lengths > 0
+                if arrived.any():
+                    laid = (np.arange(max_steps) < lengths[:, None]) & arrived[:, None]
+                    amounts = np.broadcast_to(1.0 / np.maximum(lengths, 1)[:, None], edges.shape)
+                    np.add.at(pheromones, edges[laid], amounts[laid])
+                    shortest = int(np.flatnonzero(arrived)[np.argmin(lengths[arrived])])
+                    path = (edges[shortest, :lengths[shortest]] // len(DIRECTIONS)).tolist() + [goal]
+                    if best is None or len(path) < len(best):
+                        best = path
+                elif lengths.max() == 0:
+                    best = [goal]
+                pheromones *= 1 - decay
+        finally:
+            # Drop the view of the shared buffer before it is closed.
+            pheromones = None
+
+    if best is None:
+        return None
+    return array.array("L", reversed(best))
@@ -1,14 +1,22 @@
 # converter.py
 
+import array
+import itertools
 import math
-from typing import NamedTuple, Set
-
-import networkx as nx
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
+from maze_solver.graphs.registry import SolverInfo
+from maze_solver.graphs.weights import DEFAULT_BONUS, DEFAULT_PENALTY
 from maze_solver.models.border import Border
 from maze_solver.models.maze import Maze
 from maze_solver.models.role import Role
+from maze_solver.models.solution import PathSteps
 from maze_solver.models.square import Square
+from maze_solver.persistence.serializer import decode_planes
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 Node = Square
 
@@ -27,7 +35,7 @@ class Edge(NamedTuple):
             (self.node2.row, self.node2.column)
         )
 
-    def weight(self, bonus=1, penalty=2) -> float:
+    def weight(self, bonus=DEFAULT_BONUS, penalty=DEFAULT_PENALTY) -> float:
         if self.node2.role == Role.REWARD:
             return self.distance - bonus
         elif self.node2.role == Role.ENEMY:
@@ -76,8 +84,178 @@ def get_edges(maze: Maze, nodes: Set[Node]) -> Set[Edge]:
 def get_directed_edges(maze: Maze, nodes: Set[Node]) -> Set[Edge]:
     return (edges := get_edges(maze, nodes)) | {edge.flip for edge in edges}
 
-def make_graph(maze: Maze) -> nx.DiGraph:
+def make_graph(maze: Maze) -> "nx.DiGraph":
+    import networkx as nx
     return nx.DiGraph(
         (edge.node1, edge.node2, {"weight": edge.weight()})
         for edge in get_directed_edges(maze, get_nodes(maze))
     )
+
+# Squares whose open directions don't make a plain corridor square.
+NOT_CORRIDOR = bytes(bin(mask & 0xf).count("1") != 2 for mask in range(256))
+HAS_ROLE = bytes(role != Role.NONE for role in range(256))
+
+# Edges leaving a node, keyed by the first square stepped into, so that
+# two corridors joining the same pair of nodes are kept apart.
+NodeEdges = Dict[int, Tuple[int, int]]  # first square -> (target node, length)
+
+@dataclass(frozen=True)
+class JunctionGraph:
+    """The maze with every corridor contracted into a single weighted edge.
+
+    Nodes are squares that aren't a plain corridor square: junctions, dead
+    ends and squares with a role. Corridors may turn, since walking one
+    only ever has a single way forward. Edge lengths count the squares
+    stepped through, so shortest paths here are shortest paths in the maze.
+    """
+    nodes: bytes
+    edges: Dict[int, NodeEdges]
+
+    @classmethod
+    def build(cls, maze: Maze) -> "JunctionGraph":
+        adjacency = maze.adjacency
+        corridors = bytes(adjacency.open_directions).translate(NOT_CORRIDOR)
+        roles = decode_planes(maze.square_values)[1].translate(HAS_ROLE)
+        size = len(corridors)
+        nodes = (
+            int.from_bytes(corridors, "little") | int.from_bytes(roles, "little")
+        ).to_bytes(size, "little")
+
+        edges: Dict[int, NodeEdges] = {}
+        for node in itertools.compress(range(size), nodes):
+            edges[node] = {
+                first: follow_corridor(adjacency.neighbors, nodes, node, first)[:2]
+                for first in adjacency.neighbors(node)
+            }
+        return cls(nodes, edges)
+
+    def __len__(self) -> int:
+        return len(self.edges)
+
+    def around(self, maze: Maze, start: int, goal: int) -> "JunctionAdjacency":
+        return JunctionAdjacency(self, maze.adjacency.neighbors, (start, goal))
+
+class JunctionAdjacency:
+    """Adjacency over a junction graph, for a single start and goal.
+
+    Start and goal squares lying inside a corridor become extra nodes that
+    split it in two. Only the nodes at the ends of such corridors get their
+    edges copied, the shared graph is left untouched.
+    """
+
+    # Edges cost the squares they step through, so at least one per grid step.
+    min_cost = 1
+
+    def __init__(self, graph: JunctionGraph, grid_neighbors, terminals: Iterable[int]) -> None:
+        self.graph = graph
+        self._grid_neighbors = grid_neighbors
+        self._extra = {index for index in terminals if not graph.nodes[index]}
+        self._edges: Dict[int, NodeEdges] = {}
+        self._lengths: Dict[int, Dict[int, int]] = {}
+        for extra in self._extra:
+            self._edges[extra] = {}
+            for first in grid_neighbors(extra):
+                target, length, last = follow_corridor(
+                    grid_neighbors, graph.nodes, extra, first, self._extra
+                )
+                self._edges[extra][first] = (target, length)
+                if target not in self._extra:
+                    self._edges.setdefault(target, dict(graph.edges[target]))[last] = (extra, length)
+
+    def edges(self, index: int) -> NodeEdges:
+        edges = self._edges.get(index)
+        if edges is None:
+            edges = self.graph.edges.get(index, {})
+        return edges
+
+    def lengths(self, index: int) -> Dict[int, int]:
+        """Shortest edge length to each neighboring node."""
+        lengths = self._lengths.get(index)
+        if lengths is None:
+            lengths = {}
+            for target, length in self.edges(index).values():
+                if target != index and length < lengths.get(target, length + 1):
+                    lengths[target] = length
+            self._lengths[index] = lengths
+        return lengths
+
+    def neighbors(self, index: int) -> List[int]:
+        return list(self.lengths(index))
+
+    def cost(self, source: int, target: int) -> int:
+        return self.lengths(source)[target]
+
+    def expand(self, nodes: Iterable[int]) -> array.array:
+        """Squares along a path of neighboring nodes, in the same order."""
+        nodes = iter(nodes)
+        indices = array.array("L")
+        previous = next(nodes, None)
+        if previous is None:
+            return indices
+        indices.append(previous)
+        for node in nodes:
+            if node == previous:
+                continue
+            length = self.cost(previous, node)
+            first = next(
+                first for first, edge in self.edges(previous).items()
+                if edge == (node, length)
+            )
+            indices.extend(self._walk(previous, first, node))
+            previous = node
+        return indices
+
+    def _walk(self, source: int, first: int, target: int) -> List[int]:
+        squares = [first]
+        previous, current = source, first
+        while current != target:
+            a, b = self._grid_neighbors(current)
+            previous, current = current, b if a == previous else a
+            squares.append(current)
+        return squares
+
+class ContractedMaze:
+    """Stand-in for a maze whose adjacency is a junction graph.
+
+    Solvers only reach the grid through `adjacency` and square indices,
+    so they run on it unchanged and return paths made of nodes.
+    """
+
+    def __init__(self, maze: Maze, adjacency: JunctionAdjacency) -> None:
+        self.maze = maze
+        self.width = maze.width
+        self.height = maze.height
+        self.squares = maze.squares
+        self.adjacency = adjacency
+
+def follow_corridor(
+    neighbors,
+    nodes: bytes,
+    source: int,
+    first: int,
+    stops: Set[int] = frozenset(),
+) -> Tuple[int, int, int]:
+    """Walk from source through first until the next node.
+
+    Returns the node reached, the number of steps taken and the square
+    just before the node.
+    """
+    previous, current, length = source, first, 1
+    while not nodes[current] and current not in stops:
+        a, b = neighbors(current)
+        previous, current = current, b if a == previous else a
+        length += 1
+    return current, length, previous
+
+def solve_contracted(maze: Maze, start: Square, goal: Square, solver: SolverInfo) -> Optional[PathSteps]:
+    """Run a solver on the junction graph and expand its path back to squares."""
+    if solver.grid_only:
+        raise ValueError(f"{solver.name} needs the full grid and can't search the junction graph")
+    adjacency = maze.junction_graph.around(maze, start.index, goal.index)
+    solution_steps = solver(ContractedMaze(maze, adjacency), start, goal)
+    if not solution_steps:
+        return None
+    nodes = [square.index for square in solution_steps[0]]
+    if nodes[0] != goal.index:
+        nodes.reverse()
+    return PathSteps(maze.squares, adjacency.expand(nodes))
@@ -0,0 +1,113 @@
+# distance.py
+import array
+import pathlib
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from maze_solver.graphs.adjacency import direction_offsets
+from maze_solver.models.maze import Maze
+from maze_solver.models.solution import PathSteps
+
+UNREACHABLE = 0xffffffff
+
+# Fields kept in memory, keyed by maze digest and goal index.
+MEMORY_CACHE_SIZE = 8
+_cache: "OrderedDict[Tuple[str, int], DistanceField]" = OrderedDict()
+
+@dataclass(frozen=True)
+class DistanceField:
+    """Steps from every square to one goal, UNREACHABLE where cut off.
+
+    Built with a single breadth-first search out of the goal. Walking to
+    any neighbor one step closer then leads to the goal along a shortest
+    path, with no further searching.
+    """
+    width: int
+    height: int
+    goal: int
+    distances: array.array
+
+    @classmethod
+    def build(cls, maze: Maze, goal: int) -> "DistanceField":
+        distances = array.array("I", [UNREACHABLE]) * (maze.width * maze.height)
+        masks = maze.adjacency.open_directions
+        offsets = direction_offsets(maze.width)
+        distances[goal] = 0
+        frontier = [goal]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for current in frontier:
+                for delta in offsets[masks[current]]:
+                    neighbor = current + delta
+                    if distances[neighbor] == UNREACHABLE:
+                        distances[neighbor] = distance
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return cls(maze.width, maze.height, goal, distances)
+
+    @classmethod
+    def load(cls, maze: Maze, goal: int, path: pathlib.Path) -> "DistanceField":
+        distances = array.array("I")
+        distances.frombytes(path.read_bytes())
+        if len(distances) != maze.width * maze.height:
+            raise ValueError(f"Distance field size doesn't match the maze: {path}")
+        if sys.byteorder == "big":
+            distances.byteswap()
+        return cls(maze.width, maze.height, goal, distances)
+
+    def dump(self, path: pathlib.Path) -> None:
+        distances = array.array("I", self.distances)
+        if sys.byteorder == "big":
+            distances.byteswap()  # Stored little-endian, like maze files.
+        path.write_bytes(distances.tobytes())
+
+    def path_from(self, maze: Maze, start: int) -> Optional[PathSteps]:
+        distances = self.distances
+        if distances[start] == UNREACHABLE:
+            return None
+        masks = maze.adjacency.open_directions
+        offsets = direction_offsets(maze.width)
+        indices = array.array("L", [start])
+        current = start
+        for distance in range(distances[start] - 1, -1, -1):
+            for delta in offsets[masks[current]]:
+                if distances[current + delta] == distance:
+                    current += delta
+                    break
+            indices.append(current)
+        indices.reverse()
+        return PathSteps(maze.squares, indices)
+
+def clear_cache() -> None:
+    """Forget every field held in memory; files in a cache_dir are kept."""
+    _cache.clear()
+
+def distance_field(maze: Maze, goal: int, cache_dir: Optional[pathlib.Path] = None) -> DistanceField:
+    """Distance field for a goal, from memory, then cache_dir, then built.
+
+    Fields are keyed by the maze digest, so editing a maze file never
+    serves a stale field for its old contents.
+    """
+    key = (maze.digest, goal)
+    field = _cache.get(key)
+    if field is not None:
+        _cache.move_to_end(key)
+        return field
+
+    path = cache_dir / f"{maze.digest}-{goal}.dist" if cache_dir is not None else None
+    if path is not None and path.exists():
+        field = DistanceField.load(maze, goal, path)
+    else:
+        field = DistanceField.build(maze, goal)
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            field.dump(path)
+
+    _cache[key] = field
+    if len(_cache) > MEMORY_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return field
@@ -0,0 +1,250 @@
+# genetic.py
+import array
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Tuple
+
+from maze_solver.graphs.adjacency import DIRECTIONS, direction_deltas
+from maze_solver.models.maze import Maze
+
+if TYPE_CHECKING:
+    import numpy as np
+
+POPULATION_SIZE = 200
+GENERATIONS = 50
+MUTATION_RATE = 0.02  # Chance of each gene being redrawn
+STEP_CAP = 20_000
+
+class Walks:
+    """A batch of walks through the maze, one per row, moved in lockstep.
+
+    A walk never steps onto a square it has already visited. Where every
+    open neighbor has been visited (a dead end, or a loop closing), it
+    retreats one square along its own path instead. Each walk is thereby
+    a randomised depth-first search: it reaches any goal in its part of
+    the maze within two moves per square, and the squares it hasn't
+    retreated from always form a path without loops.
+
+    Paths and visited bitsets are flat arrays with one stretch per walk,
+    so every lookup is a single take from a 1D array.
+    """
+
+    def __init__(self, count: int, size: int, start: int, max_steps: int) -> None:
+        import numpy as np
+        self.positions = np.full(count, start, dtype=np.int64)
+        self.depths = np.zeros(count, dtype=np.int64)  # -1 once a walk has retreated past the start
+        self.path_base = np.arange(count, dtype=np.int64) * (max_steps + 1)
+        self.path = np.zeros(count * (max_steps + 1), dtype=np.int64)
+        self.path[self.path_base] = start
+        # Index in DIRECTIONS of the move onto each path square.
+        self.directions = np.zeros(count * (max_steps + 1), dtype=np.int64)
+        self.seen_base = np.arange(count, dtype=np.int64) * ((size + 7) // 8)
+        self.seen = np.zeros(count * ((size + 7) // 8), dtype=np.uint8)
+        self.seen[self.seen_base + (start >> 3)] = 1 << (start & 7)
+
+    def options(
+        self, rows: "np.ndarray", masks: "np.ndarray", opened: "np.ndarray", deltas: "np.ndarray"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Neighbor in each direction of the given walks, and whether it may be entered."""
+        positions = self.positions[rows]
+        open_directions = opened[masks[positions]]
+        # Closed directions point back at the square itself, which is
+        # always in bounds and always visited.
+        targets = positions[:, None] + deltas * open_directions
+        visited = self.seen[self.seen_base[rows, None] + (targets >> 3)] >> (targets & 7) & 1
+        return targets, open_directions & (visited == 0)
+
+    def move(self, rows: "np.ndarray", targets: "np.ndarray", free: "np.ndarray", choices: "np.ndarray") -> None:
+        """Step each walk in its chosen direction, or retreat it if no direction is free."""
+        import numpy as np
+        onward = free.any(axis=1)
+        forward, chosen = rows[onward], choices[onward]
+        squares = targets[onward, chosen]
+        depths = self.depths[forward] + 1
+        self.depths[forward] = depths
+        self.path[self.path_base[forward] + depths] = squares
+        self.directions[self.path_base[forward] + depths] = chosen
+        self.seen[self.seen_base[forward] + (squares >> 3)] |= (1 << (squares & 7)).astype(np.uint8)
+        self.positions[forward] = squares
+        if not onward.all():
+            back = rows[~onward]
+            depths = self.depths[back] - 1
+            self.depths[back] = depths
+            self.positions[back] = self.path[self.path_base[back] + np.maximum(depths, 0)]
+
+    def squares(self, row: int) -> "np.ndarray":
+        """Squares on a walk's path, start first."""
+        base = self.path_base[row]
+        return self.path[base:base + self.depths[row] + 1]
+
+    def edges(self, row: int) -> "np.ndarray":
+        """The (square * 4 + direction) edges along a walk's path."""
+        base = self.path_base[row]
+        depth = self.depths[row]
+        return self.path[base:base + depth] * len(DIRECTIONS) + self.directions[base + 1:base + depth + 1]
+
+@dataclass(frozen=True)
+class WalkTables:
+    """Lookup tables turning genes into moves for a whole population at once.
+
+    A gene is a byte choosing among the directions a walk may take from
+    the square it is on (gene modulo their count), so every move is legal
+    and a genome always decodes to a walk through the maze. Walks follow
+    the rules of Walks, so they never wander back over their own tracks.
+    """
+    width: int
+    size: int
+    start: int
+    goal: int
+    masks: "np.ndarray"   # Open directions of each square
+    opened: "np.ndarray"  # Whether each direction of a mask is open, in DIRECTIONS order
+    deltas: "np.ndarray"  # Index delta of each direction
+
+    @classmethod
+    def build(cls, maze: Maze, start: int, goal: int) -> "WalkTables":
+        import numpy as np
+        deltas = direction_deltas(maze.width)
+        opened = np.array([[bool(mask & direction) for direction in DIRECTIONS] for mask in range(16)])
+        masks = np.frombuffer(bytes(maze.adjacency.open_directions), dtype=np.uint8)
+        return cls(
+            maze.width, len(masks), start, goal, masks, opened,
+            np.array([deltas[direction] for direction in DIRECTIONS], dtype=np.int64),
+        )
+
+    def walk(self, genomes: "np.ndarray") -> Tuple[Walks, "np.ndarray"]:
+        """Decode genomes into walks, with the moves each took to reach the goal (-1 if it didn't)."""
+        import numpy as np
+        size, length = genomes.shape
+        walks = Walks(size, self.size, self.start, length)
+        moves = np.full(size, 0 if self.start == self.goal else -1, dtype=np.int64)
+        rows = np.flatnonzero(moves < 0)
+        for step in range(length):
+            if not len(rows):
+                break
+            targets, free = walks.options(rows, self.masks, self.opened, self.deltas)
+            # The k-th free direction, k being the gene modulo their count.
+            ranks = genomes[rows, step] % np.maximum(free.sum(axis=1), 1)
+            choices = (np.cumsum(free, axis=1) <= ranks[:, None]).sum(axis=1)
+            walks.move(rows, targets, free, choices)
+            arrived = walks.positions[rows] == self.goal
+            done = arrived | (walks.depths[rows] < 0)
+            if done.any():
+                moves[rows[arrived]] = step + 1
+                rows = rows[~done]
+        return walks, moves
+
+    def fitness(self, genomes: "np.ndarray", limit: Optional[int] = None) -> "np.ndarray":
+        """Moves taken to reach the goal, or more than any genome's length if never reached.
+
+        Walks that miss the goal rank by how close (Manhattan) they end
+        up. Walks are cut off after `limit` moves, if given, and then count
+        as misses.
+        """
+        import numpy as np
+        length = genomes.shape[1]
+        walks, moves = self.walk(genomes[:, :limit])
+        rows, columns = np.divmod(walks.positions, self.width)
+        goal_row, goal_column = divmod(self.goal, self.width)
+        missed = length + 1 + np.abs(rows - goal_row) + np.abs(columns - goal_column)
+        return np.where(moves >= 0, moves, missed)
+
+    def trace(self, genome: "np.ndarray") -> Optional[array.array]:
+        """The genome's path, goal first, or None if it misses the goal."""
+        walks, moves = self.walk(genome[None, :])
+        if moves[0] < 0:
+            return None
+        return array.array("L", reversed(walks.squares(0).tolist()))
+
+def out_of_reach(width: int, start: int, goal: int, max_steps: int) -> bool:
+    """Whether no walk of max_steps moves can get from start to goal.
+
+    Manhattan distance is a lower bound on the moves needed, so this
+    rules out hopeless searches before any walk is drawn.
+    """
+    start_row, start_column = divmod(start, width)
+    goal_row, goal_column = divmod(goal, width)
+    return abs(start_row - goal_row) + abs(start_column - goal_column) > max_steps
+
+_tables: Optional[WalkTables] = None
+
+def _init_worker(tables: WalkTables) -> None:
+    global _tables
+    _tables = tables
+
+def _worker_fitness(genomes: "np.ndarray", limit: Optional[int]) -> "np.ndarray":
+    return _tables.fitness(genomes, limit)
+
+@contextlib.contextmanager
+def evaluator(
+    tables: WalkTables, workers: int = 1
+) -> Iterator[Callable[["np.ndarray", Optional[int]], "np.ndarray"]]:
+    """Fitness function, splitting the population across worker processes if workers > 1."""
+    if workers <= 1:
+        yield tables.fitness
+        return
+    import numpy as np
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,)) as executor:
+        def evaluate(genomes: "np.ndarray", limit: Optional[int] = None) -> "np.ndarray":
+            chunks = np.array_split(genomes, workers)
+            return np.concatenate(list(executor.map(_worker_fitness, chunks, [limit] * len(chunks))))
+        yield evaluate
+
+def evolve(
+    maze: Maze,
+    start: int,
+    goal: int,
+    population_size: int = POPULATION_SIZE,
+    generations: int = GENERATIONS,
+    mutation_rate: float = MUTATION_RATE,
+    max_steps: Optional[int] = None,
+    workers: int = 1,
+    seed: Optional[int] = None,
+) -> Optional[array.array]:
+    """Evolve walks from start to goal and return the best one, goal first.
+
+    The population is a (population_size, max_steps) array of genes.
+    Every generation keeps the half that reached the goal in the fewest
+    moves, refills the rest by one-point crossover of random survivors
+    and redraws genes at mutation_rate, all as whole-array operations.
+    Walks are cut at max_steps, which defaults to four moves per square
+    up to STEP_CAP; if the goal is further than that from the start,
+    None is returned without evolving anything.
+    """
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    if max_steps is None:
+        max_steps = min(4 * maze.width * maze.height, STEP_CAP)
+    if out_of_reach(maze.width, start, goal, max_steps):
+        return None
+    tables = WalkTables.build(maze, start, goal)
+    population = rng.integers(0, 256, (population_size, max_steps), dtype=np.uint8)
+    survivors = max(population_size // 2, 1)
+    offspring = population_size - survivors
+    positions = np.arange(max_steps)
+
+    with evaluator(tables, workers) as evaluate:
+        fitness = evaluate(population)
+        for _ in range(generations):
+            order = np.argsort(fitness, kind="stable")[:survivors]
+            population, fitness = population[order], fitness[order]
+            if not offspring:
+                continue
+            parents = rng.integers(0, survivors, (2, offspring))
+            points = rng.integers(0, max_steps, offspring)
+            children = np.where(
+                positions < points[:, None], population[parents[0]], population[parents[1]]
+            )
+            mutated = rng.random(children.shape, dtype=np.float32) < mutation_rate
+            children[mutated] = rng.integers(0, 256, int(mutated.sum()), dtype=np.uint8)
+            # A child only survives by beating the worst survivor, so once
+            # every survivor reaches the goal, walks are cut off there.
+            worst = int(fitness[-1])
+            limit = worst - 1 if worst <= max_steps else None
+            population = np.concatenate([population, children])
+            fitness = np.concatenate([fitness, evaluate(children, limit)])
+
+    best = int(np.argmin(fitness))
+    if fitness[best] > max_steps:
+        return None
+    return tables.trace(population[best])
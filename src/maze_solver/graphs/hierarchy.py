@@ -0,0 +1,228 @@
+# hierarchy.py
+import array
+import heapq
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from maze_solver.graphs.adjacency import direction_offsets
+from maze_solver.models.border import Border
+from maze_solver.models.maze import Maze
+
+DEFAULT_CLUSTER_SIZE = 32
+
+# bytes.translate() tables picking out squares open to the right / bottom.
+OPEN_RIGHT = bytes(bool(mask & Border.RIGHT) for mask in range(256))
+OPEN_BOTTOM = bytes(bool(mask & Border.BOTTOM) for mask in range(256))
+CLOSE = {side: bytes(mask & ~side & 0xff for mask in range(256)) for side in (Border.TOP, Border.BOTTOM)}
+
+@dataclass(frozen=True)
+class ClusterGraph:
+    """Abstract graph for hierarchical pathfinding (HPA*).
+
+    The maze is cut into square clusters. Every open edge crossing a
+    cluster boundary makes its two squares transitions, joined by a step
+    of length 1, and transitions of the same cluster are joined by their
+    shortest distance inside it. A shortest path only leaves a cluster
+    through transitions, so searching this graph and then refining each
+    hop inside its cluster still gives a shortest path.
+    """
+    width: int
+    height: int
+    cluster_size: int
+    transitions: Dict[int, List[int]]  # cluster -> transition squares inside it
+    edges: Dict[int, Dict[int, int]]   # transition -> neighboring transition -> length
+
+    @classmethod
+    def build(cls, maze: Maze, cluster_size: int = DEFAULT_CLUSTER_SIZE) -> "ClusterGraph":
+        width, height = maze.width, maze.height
+        masks = maze.adjacency.open_directions
+        graph = cls(width, height, cluster_size, {}, {})
+
+        def connect(a: int, b: int) -> None:
+            for source, target in ((a, b), (b, a)):
+                if source not in graph.edges:
+                    graph.edges[source] = {}
+                    graph.transitions.setdefault(graph.cluster_of(source), []).append(source)
+                graph.edges[source][target] = 1
+
+        for column in range(cluster_size - 1, width - 1, cluster_size):
+            crossing = bytes(masks[column::width]).translate(OPEN_RIGHT)
+            for row in itertools.compress(range(height), crossing):
+                index = row * width + column
+                connect(index, index + 1)
+        for row in range(cluster_size - 1, height - 1, cluster_size):
+            crossing = bytes(masks[row * width:(row + 1) * width]).translate(OPEN_BOTTOM)
+            for column in itertools.compress(range(width), crossing):
+                index = row * width + column
+                connect(index, index + width)
+
+        for transitions in graph.transitions.values():
+            grid = graph.cluster_grid(maze, transitions[0])
+            local = [grid.local(transition) for transition in transitions]
+            for source, local_source in zip(transitions, local):
+                distances = grid.distances(local_source)
+                edges = graph.edges[source]
+                for target, local_target in zip(transitions, local):
+                    if target != source and distances[local_target] >= 0:
+                        edges[target] = distances[local_target]
+        return graph
+
+    def cluster_of(self, index: int) -> int:
+        row, column = divmod(index, self.width)
+        clusters_per_row = -(-self.width // self.cluster_size)
+        return (row // self.cluster_size) * clusters_per_row + column // self.cluster_size
+
+    def cluster_grid(self, maze: Maze, index: int) -> "ClusterGrid":
+        """The cluster holding a square, cut out of the maze."""
+        width, size = self.width, self.cluster_size
+        masks = maze.adjacency.open_directions
+        row, column = divmod(index, width)
+        top, left = row - row % size, column - column % size
+        local_width = min(left + size, width) - left
+        local_height = min(top + size, self.height) - top
+        local_masks = bytearray()
+        for row in range(top, top + local_height):
+            local_masks += bytes(masks[row * width + left:row * width + left + local_width])
+        # Close off every edge leaving the cluster.
+        local_masks[:local_width] = local_masks[:local_width].translate(CLOSE[Border.TOP])
+        local_masks[-local_width:] = local_masks[-local_width:].translate(CLOSE[Border.BOTTOM])
+        for start in range(0, len(local_masks), local_width):
+            local_masks[start] &= ~Border.LEFT
+            local_masks[start + local_width - 1] &= ~Border.RIGHT
+        return ClusterGrid(top * width + left, width, local_width, bytes(local_masks))
+
+    def search(self, maze: Maze, start: int, goal: int) -> Optional[array.array]:
+        """Shortest path from start to goal as square indices, goal first."""
+        nodes = self._abstract_path(maze, start, goal)
+        if nodes is None:
+            return None
+        indices = array.array("L", [start])
+        for source, target in zip(nodes, nodes[1:]):
+            if self.cluster_of(source) != self.cluster_of(target):
+                indices.append(target)
+            else:
+                indices.extend(self.cluster_grid(maze, source).path(source, target))
+        indices.reverse()
+        return indices
+
+    def _abstract_path(self, maze: Maze, start: int, goal: int) -> Optional[List[int]]:
+        # Start and goal join the graph for this query only: start through
+        # its edges out, goal through the edges of its cluster's transitions
+        # leading into it. The shared graph is left untouched.
+        start_edges = dict(self.edges.get(start, {}))
+        grid = self.cluster_grid(maze, start)
+        distances = grid.distances(grid.local(start))
+        targets = list(self.transitions.get(self.cluster_of(start), []))
+        if self.cluster_of(goal) == self.cluster_of(start):
+            targets.append(goal)
+        for target in targets:
+            if target != start and distances[grid.local(target)] >= 0:
+                start_edges[target] = distances[grid.local(target)]
+        grid = self.cluster_grid(maze, goal)
+        distances = grid.distances(grid.local(goal))
+        into_goal = {
+            transition: distances[grid.local(transition)]
+            for transition in self.transitions.get(self.cluster_of(goal), [])
+            if distances[grid.local(transition)] >= 0
+        }
+
+        width = self.width
+        goal_row, goal_column = divmod(goal, width)
+
+        def heuristic(index: int) -> int:
+            row, column = divmod(index, width)
+            return abs(row - goal_row) + abs(column - goal_column)
+
+        open_set = [(heuristic(start), 0, start)]
+        came_from: Dict[int, Optional[int]] = {start: None}
+        g_score = {start: 0}
+        while open_set:
+            _, g, current = heapq.heappop(open_set)
+            if g != g_score[current]:
+                continue  # Superseded by a cheaper entry pushed later
+            if current == goal:
+                nodes = []
+                while current is not None:
+                    nodes.append(current)
+                    current = came_from[current]
+                return nodes[::-1]
+
+            edges = start_edges if current == start else self.edges.get(current, {})
+            if current in into_goal:
+                edges = {**edges, goal: into_goal[current]}
+            for neighbor, length in edges.items():
+                tentative_g_score = g + length
+                if tentative_g_score < g_score.get(neighbor, tentative_g_score + 1):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    heapq.heappush(open_set, (tentative_g_score + heuristic(neighbor), tentative_g_score, neighbor))
+        return None
+
+@dataclass(frozen=True)
+class ClusterGrid:
+    """A cluster's open-direction masks, with no way out of the cluster.
+
+    Searches run on local indices, so staying inside the cluster costs
+    no bounds checks.
+    """
+    origin: int  # Maze index of the top-left square
+    maze_width: int
+    width: int
+    masks: bytes
+
+    def local(self, index: int) -> int:
+        row, column = divmod(index - self.origin, self.maze_width)
+        return row * self.width + column
+
+    def index(self, local: int) -> int:
+        row, column = divmod(local, self.width)
+        return self.origin + row * self.maze_width + column
+
+    def _search(self, source: int, target: int = -1) -> List[int]:
+        """BFS parents by local index, -1 where unreached, stopping at target."""
+        masks = self.masks
+        offsets = direction_offsets(self.width)
+        came_from = [-1] * len(masks)
+        came_from[source] = source
+        frontier = [source]
+        while frontier and came_from[target] < 0:
+            next_frontier = []
+            for current in frontier:
+                for delta in offsets[masks[current]]:
+                    neighbor = current + delta
+                    if came_from[neighbor] < 0:
+                        came_from[neighbor] = current
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return came_from
+
+    def distances(self, source: int) -> List[int]:
+        """BFS distances by local index, -1 where unreachable inside the cluster."""
+        masks = self.masks
+        offsets = direction_offsets(self.width)
+        distances = [-1] * len(masks)
+        distances[source] = 0
+        frontier = [source]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for current in frontier:
+                for delta in offsets[masks[current]]:
+                    neighbor = current + delta
+                    if distances[neighbor] < 0:
+                        distances[neighbor] = distance
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+        return distances
+
+    def path(self, source: int, target: int) -> List[int]:
+        """Squares after source up to target, along a shortest path in the cluster."""
+        local_source, current = self.local(source), self.local(target)
+        came_from = self._search(local_source, current)
+        squares = []
+        while current != local_source:
+            squares.append(self.index(current))
+            current = came_from[current]
+        return squares[::-1]
@@ -0,0 +1,171 @@
+# incremental.py
+import array
+import heapq
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from maze_solver.graphs.adjacency import OPEN_SIDES, Adjacency, direction_offsets
+from maze_solver.graphs.solver import SearchStats
+from maze_solver.models.border import Border
+from maze_solver.models.maze import Maze, SquareView
+from maze_solver.models.role import Role
+from maze_solver.models.solution import PathSteps
+from maze_solver.models.square import Square
+from maze_solver.persistence.serializer import decode_planes
+
+INF = float('inf')
+
+Key = Tuple[float, float]
+
+class IncrementalSolver:
+    """Lifelong Planning A* (LPA*) between a fixed start and goal.
+
+    The search state (g-values, one-step lookaheads and the open queue)
+    survives between calls to solve(). update() applies a batch of
+    edited squares and only puts the squares whose edges changed back on
+    the queue, so the next solve() repairs just the part of the
+    shortest-path tree the edits touched.
+
+    Squares with Role.WALL can't be entered, so toggling a wall opens or
+    closes a square without touching any borders.
+    """
+
+    def __init__(self, maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> None:
+        self.width = maze.width
+        self.height = maze.height
+        self.square_values = bytearray(maze.square_values)
+        self.squares = SquareView(self.square_values, self.width)
+        self.offsets = direction_offsets(self.width)
+        self.masks = bytearray(Adjacency.build(self.width, self.height, self.square_values).open_directions)
+        roles = decode_planes(self.square_values)[1]
+        wall = roles.find(Role.WALL)
+        while wall >= 0:
+            for index in (wall, *self._grid_neighbors(wall)):
+                self.masks[index] = self._decode(index)
+            wall = roles.find(Role.WALL, wall + 1)
+        self.start = start.index
+        self.goal = goal.index
+        self.goal_row, self.goal_column = divmod(goal.index, self.width)
+        self.stats = stats
+        self.g: Dict[int, float] = {}
+        self.rhs: Dict[int, float] = {self.start: 0}
+        self.queue: List[Tuple[Key, int]] = []
+        # Current key of every queued square; heap entries with another key are stale.
+        self.queued: Dict[int, Key] = {}
+        self._push(self.start)
+
+    @property
+    def maze(self) -> Maze:
+        """Snapshot of the maze with every update applied."""
+        return Maze(self.width, self.height, array.array("B", self.square_values))
+
+    def update(self, squares: Iterable[Square]) -> None:
+        """Replace squares by index, e.g. with new borders or a toggled wall."""
+        touched = set()
+        for square in squares:
+            self.square_values[square.index] = (square.role << 4) | square.border
+            touched.add(square.index)
+            touched.update(self._grid_neighbors(square.index))
+        for index in touched:
+            self.masks[index] = self._decode(index)
+        for index in touched:
+            self._update_vertex(index)
+
+    def solve(self) -> Optional[PathSteps]:
+        """Shortest path from start to goal in the current maze, or None."""
+        self._compute_shortest_path()
+        g = self.g
+        if g.get(self.goal, INF) == INF:
+            return None
+        indices = array.array("L", [self.goal])
+        current = self.goal
+        while current != self.start:
+            current = min(self._neighbors(current), key=lambda index: g.get(index, INF))
+            indices.append(current)
+        return PathSteps(self.squares, indices)
+
+    def _compute_shortest_path(self) -> None:
+        g, rhs, queue, queued = self.g, self.rhs, self.queue, self.queued
+        goal = self.goal
+        while queue:
+            key, current = queue[0]
+            if queued.get(current) != key:
+                heapq.heappop(queue)
+                continue  # Superseded by a later push, or made consistent
+            if key >= self._key(goal) and g.get(goal, INF) == rhs.get(goal, INF):
+                break
+            heapq.heappop(queue)
+            del queued[current]
+            if self.stats is not None:
+                self.stats.expanded += 1
+            if g.get(current, INF) > rhs.get(current, INF):
+                g[current] = rhs[current]
+            else:
+                g[current] = INF
+                self._update_vertex(current)
+            for neighbor in self._neighbors(current):
+                self._update_vertex(neighbor)
+
+    def _update_vertex(self, index: int) -> None:
+        g, rhs = self.g, self.rhs
+        if index != self.start:
+            best = INF
+            for delta in self.offsets[self.masks[index]]:
+                best = min(best, g.get(index + delta, INF))
+            rhs[index] = best + 1
+        if g.get(index, INF) != rhs.get(index, INF):
+            self._push(index)
+        else:
+            self.queued.pop(index, None)
+
+    def _push(self, index: int) -> None:
+        key = self._key(index)
+        if self.queued.get(index) != key:
+            self.queued[index] = key
+            heapq.heappush(self.queue, (key, index))
+            if self.stats is not None:
+                self.stats.heap_pushes += 1
+
+    def _key(self, index: int) -> Key:
+        best = min(self.g.get(index, INF), self.rhs.get(index, INF))
+        row, column = divmod(index, self.width)
+        return best + abs(row - self.goal_row) + abs(column - self.goal_column), best
+
+    def _neighbors(self, index: int) -> List[int]:
+        return [index + delta for delta in self.offsets[self.masks[index]]]
+
+    def _grid_neighbors(self, index: int) -> List[int]:
+        row, column = divmod(index, self.width)
+        neighbors = []
+        if row > 0:
+            neighbors.append(index - self.width)
+        if column < self.width - 1:
+            neighbors.append(index + 1)
+        if row < self.height - 1:
+            neighbors.append(index + self.width)
+        if column > 0:
+            neighbors.append(index - 1)
+        return neighbors
+
+    def _decode(self, index: int) -> int:
+        """Open directions of a square, closed towards (and out of) walls."""
+        square_values = self.square_values
+        if square_values[index] >> 4 == Role.WALL:
+            return 0
+        width = self.width
+        row, column = divmod(index, width)
+        own = OPEN_SIDES[square_values[index]]
+        mask = 0
+        for side, neighbor, opposite, inside in (
+            (Border.TOP, index - width, Border.BOTTOM, row > 0),
+            (Border.RIGHT, index + 1, Border.LEFT, column < width - 1),
+            (Border.BOTTOM, index + width, Border.TOP, row < self.height - 1),
+            (Border.LEFT, index - 1, Border.RIGHT, column > 0),
+        ):
+            if (
+                inside
+                and own & side
+                and OPEN_SIDES[square_values[neighbor]] & opposite
+                and square_values[neighbor] >> 4 != Role.WALL
+            ):
+                mask |= side
+        return mask
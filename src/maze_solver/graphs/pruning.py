@@ -0,0 +1,73 @@
+# pruning.py
+import array
+import itertools
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from maze_solver.graphs.adjacency import DIRECTIONS, OPPOSITE, direction_deltas
+from maze_solver.models.maze import Maze
+from maze_solver.models.role import Role
+
+# Open directions per mask, and whether a square with that mask is a dead end.
+DEGREE = bytes(bin(mask & 0xf).count("1") for mask in range(256))
+DEAD_END = bytes(bin(mask & 0xf).count("1") <= 1 for mask in range(256))
+
+FILLED = (Role.WALL << 4) | 0xf
+
+@dataclass(frozen=True)
+class DeadEnds:
+    """Squares removed by iterative dead-end filling, one byte per square.
+
+    A dead end (at most one open direction) can't lie on a path between
+    two other squares, so it is filled and its neighbor loses a direction,
+    which may make that a dead end in turn. The kept squares are never
+    filled. What remains is every square on some path between them plus
+    any loops; in a perfect maze, only the solution path.
+    """
+    filled: bytes
+
+    @classmethod
+    def find(cls, maze: Maze, keep: Iterable[int]) -> "DeadEnds":
+        adjacency = maze.adjacency
+        masks = bytes(adjacency.open_directions)
+        degrees = bytearray(masks.translate(DEGREE))
+        filled = bytearray(len(masks))
+        kept = set(keep)
+        stack = [
+            index for index in itertools.compress(range(len(masks)), masks.translate(DEAD_END))
+            if index not in kept
+        ]
+        while stack:
+            current = stack.pop()
+            filled[current] = 1
+            for neighbor in adjacency.neighbors(current):
+                if not filled[neighbor]:
+                    degrees[neighbor] -= 1
+                    if degrees[neighbor] == 1 and neighbor not in kept:
+                        stack.append(neighbor)
+        return cls(bytes(filled))
+
+    def __len__(self) -> int:
+        return self.filled.count(1)
+
+    def apply(self, maze: Maze) -> Maze:
+        """A copy of the maze with every filled square walled in on all sides.
+
+        Neighbors get the matching border too, so solvers that only look
+        at a square's own border (like the wall follower) stay out.
+        """
+        values = array.array("B", maze.square_values)
+        masks = maze.adjacency.open_directions
+        sides = [(int(direction), direction_deltas(maze.width)[direction], int(OPPOSITE[direction])) for direction in DIRECTIONS]
+        for index in itertools.compress(range(len(values)), self.filled):
+            for direction, delta, opposite in sides:
+                if masks[index] & direction:
+                    values[index + delta] |= opposite
+            values[index] = FILLED
+        return Maze(maze.width, maze.height, values)
+
+def prune_dead_ends(maze: Maze, keep: Optional[Iterable[int]] = None) -> Maze:
+    """The maze with its dead ends filled, keeping the entrance and exit by default."""
+    if keep is None:
+        keep = (maze.entrance.index, maze.exit.index)
+    return DeadEnds.find(maze, keep).apply(maze)
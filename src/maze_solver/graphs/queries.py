@@ -0,0 +1,159 @@
+# queries.py
+import array
+import heapq
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from maze_solver.graphs.adjacency import direction_offsets
+from maze_solver.graphs.registry import get_solver
+from maze_solver.models.maze import Maze
+from maze_solver.models.solution import PathSteps, Steps
+from maze_solver.models.square import Square
+
+Query = Tuple[Square, Square]
+
+UNLABELED = 0xffffffff
+
+class QueryContext:
+    """Per-maze state shared by every query of a batch.
+
+    Holds the neighbor index, connected component labels, square
+    coordinates for the heuristic and scratch buffers. Buffers are never
+    cleared between queries: an entry only counts when its stamp matches
+    the current query's, so starting a new query is a single increment.
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        size = maze.width * maze.height
+        self.maze = maze
+        self.adjacency = maze.adjacency
+        # Searches step through offsets[masks[index]] directly rather
+        # than calling adjacency.neighbors(), saving a call and a list.
+        self.masks = list(self.adjacency.open_directions)
+        self.offsets = direction_offsets(maze.width)
+        self.components = connected_components(self.adjacency, size)
+        self.rows = [index // maze.width for index in range(size)]
+        self.columns = [index % maze.width for index in range(size)]
+        # Plain lists: indexing them is cheaper than boxing array items.
+        self.stamps = [0] * size
+        self.came_from = [-1] * size
+        self.g_score = [0] * size
+        self.queue = [0] * size
+        self.heap: list = []
+        self.stamp = 0
+
+    def connected(self, start: int, goal: int) -> bool:
+        return self.components[start] == self.components[goal]
+
+    def next_stamp(self) -> int:
+        self.stamp += 1
+        return self.stamp
+
+    def path_to(self, goal: int) -> PathSteps:
+        came_from = self.came_from
+        indices = array.array("L", [goal])
+        current = came_from[goal]
+        while current >= 0:
+            indices.append(current)
+            current = came_from[current]
+        return PathSteps(self.maze.squares, indices)
+
+def connected_components(adjacency, size: int) -> array.array:
+    """Label every square with the index of the first square of its component."""
+    labels = array.array("L", [UNLABELED]) * size
+    neighbors = adjacency.neighbors
+    for root in range(size):
+        if labels[root] != UNLABELED:
+            continue
+        labels[root] = root
+        queue = deque([root])
+        while queue:
+            for neighbor in neighbors(queue.popleft()):
+                if labels[neighbor] == UNLABELED:
+                    labels[neighbor] = root
+                    queue.append(neighbor)
+    return labels
+
+def bfs_query(context: QueryContext, start: int, goal: int) -> Optional[PathSteps]:
+    stamp = context.next_stamp()
+    stamps, came_from, queue = context.stamps, context.came_from, context.queue
+    masks, offsets = context.masks, context.offsets
+    stamps[start] = stamp
+    came_from[start] = -1
+    queue[0] = start
+    head, tail = 0, 1
+    while head < tail:
+        current = queue[head]
+        head += 1
+        if current == goal:
+            return context.path_to(goal)
+        for delta in offsets[masks[current]]:
+            neighbor = current + delta
+            if stamps[neighbor] != stamp:
+                stamps[neighbor] = stamp
+                came_from[neighbor] = current
+                queue[tail] = neighbor
+                tail += 1
+    return None
+
+def a_star_query(context: QueryContext, start: int, goal: int, use_heuristic: bool = True) -> Optional[PathSteps]:
+    stamp = context.next_stamp()
+    stamps, came_from, g_score = context.stamps, context.came_from, context.g_score
+    rows, columns = context.rows, context.columns
+    masks, offsets = context.masks, context.offsets
+    goal_row, goal_column = rows[goal], columns[goal]
+    heap = context.heap
+    heap.clear()
+
+    stamps[start] = stamp
+    came_from[start] = -1
+    g_score[start] = 0
+    heap.append((0, 0, start))
+    while heap:
+        _, g, current = heapq.heappop(heap)
+        if g != g_score[current]:
+            continue  # Superseded by a cheaper entry pushed later
+        if current == goal:
+            return context.path_to(goal)
+        tentative_g_score = g + 1
+        for delta in offsets[masks[current]]:
+            neighbor = current + delta
+            if stamps[neighbor] == stamp and tentative_g_score >= g_score[neighbor]:
+                continue
+            stamps[neighbor] = stamp
+            came_from[neighbor] = current
+            g_score[neighbor] = tentative_g_score
+            f_score = tentative_g_score
+            if use_heuristic:
+                f_score += abs(rows[neighbor] - goal_row) + abs(columns[neighbor] - goal_column)
+            heapq.heappush(heap, (f_score, tentative_g_score, neighbor))
+    return None
+
+def dijkstra_query(context: QueryContext, start: int, goal: int) -> Optional[PathSteps]:
+    return a_star_query(context, start, goal, use_heuristic=False)
+
+# Searches rewritten against QueryContext buffers; any other registered
+# solver still runs, sharing only the maze's cached indexes.
+QUERY_SOLVERS: Dict[str, Callable[[QueryContext, int, int], Optional[PathSteps]]] = {
+    "bfs": bfs_query,
+    "a-star": a_star_query,
+    "dijkstra": dijkstra_query,
+}
+
+def solve_many(maze: Maze, queries: Iterable[Query], algorithm: str = "bfs") -> Iterator[Optional[Steps]]:
+    """Solve (start, goal) pairs against one maze, yielding results in order.
+
+    Everything that depends only on the maze is built once up front, so
+    each query pays for its search alone. Pairs in different components
+    are answered None without searching.
+    """
+    solver = get_solver(algorithm)
+    search = QUERY_SOLVERS.get(algorithm)
+    context = QueryContext(maze)
+    for start, goal in queries:
+        if not context.connected(start.index, goal.index):
+            yield None
+        elif search is not None:
+            yield search(context, start.index, goal.index)
+        else:
+            yield solver(maze, start, goal)
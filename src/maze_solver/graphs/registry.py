@@ -0,0 +1,133 @@
+# registry.py
+import importlib
+import importlib.util
+import inspect
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from maze_solver.models.maze import Maze
+from maze_solver.models.solution import Steps
+from maze_solver.models.square import Square
+
+if TYPE_CHECKING:
+    from maze_solver.graphs.solver import SearchStats
+
+SolverFunction = Callable[[Maze, Square, Square], Optional[Steps]]
+
+class Complexity(IntEnum):
+    """Expected running time, ordered from cheapest to most expensive."""
+    LINEAR = 1        # O(V + E)
+    LINEARITHMIC = 2  # O(E log V)
+    QUADRATIC = 3     # O(V^2) or O(V * E)
+    STOCHASTIC = 4    # randomized, bounded only by iteration counts
+    EXPONENTIAL = 5   # exponential in the worst case, e.g. depth-limited search on loops
+
+class MemoryClass(IntEnum):
+    """Expected extra memory, ordered from smallest to largest."""
+    PATH = 1      # O(path length)
+    LINEAR = 2    # O(V)
+
+@dataclass(frozen=True)
+class SolverInfo:
+    name: str
+    function: SolverFunction
+    optimal: bool
+    complexity: Complexity
+    memory: MemoryClass
+    weighted: bool = False
+    negative_costs: bool = False  # Stays exact when some steps cost less than 0
+    grid_only: bool = False
+    reports_stats: bool = False  # Takes a SearchStats as `stats`
+    requires: Tuple[str, ...] = ()  # Optional modules the solver imports
+
+    @property
+    def available(self) -> bool:
+        return all(importlib.util.find_spec(module) is not None for module in self.requires)
+
+    def __call__(
+        self, maze: Maze, start: Square, goal: Square, stats: Optional["SearchStats"] = None
+    ) -> Optional[Steps]:
+        """Run the solver, filling in `stats` if it reports any."""
+        if not self.available:
+            raise ModuleNotFoundError(
+                f"The {self.name} solver needs {', '.join(self.requires)}: pip install 'maze-solver[fast]'"
+            )
+        if stats is not None and self.reports_stats:
+            return self.function(maze, start, goal, stats=stats)
+        return self.function(maze, start, goal)
+
+SOLVERS: Dict[str, SolverInfo] = {}
+
+def register(
+    name: str,
+    *,
+    optimal: bool,
+    complexity: Complexity,
+    memory: MemoryClass,
+    weighted: bool = False,
+    negative_costs: bool = False,
+    grid_only: bool = False,
+    requires: Tuple[str, ...] = (),
+) -> Callable[[SolverFunction], SolverFunction]:
+    """Decorator adding a solver to the registry under its CLI name."""
+    def decorator(function: SolverFunction) -> SolverFunction:
+        if name in SOLVERS:
+            raise ValueError(f"Solver already registered: {name}")
+        reports_stats = "stats" in inspect.signature(function).parameters
+        SOLVERS[name] = SolverInfo(
+            name, function, optimal, complexity, memory, weighted, negative_costs, grid_only, reports_stats, requires
+        )
+        return function
+    return decorator
+
+def _load_builtin_solvers() -> None:
+    # Importing the module runs its @register decorators.
+    importlib.import_module("maze_solver.graphs.solver")
+
+def get_solver(name: str) -> SolverInfo:
+    _load_builtin_solvers()
+    try:
+        return SOLVERS[name]
+    except KeyError:
+        raise ValueError(f"Unsupported algorithm: {name}") from None
+
+def solver_names() -> List[str]:
+    _load_builtin_solvers()
+    return list(SOLVERS)
+
+def eligible_solvers(
+    optimal: bool = False,
+    weighted: bool = False,
+    max_complexity: Complexity = Complexity.EXPONENTIAL,
+    negative_costs: bool = False,
+) -> List[SolverInfo]:
+    """Solvers meeting the requirements, cheapest first.
+
+    Ties keep registration order, so built-in solvers are listed roughly
+    from the simplest to the most specialised. Solvers whose optional
+    dependencies aren't installed are left out.
+    """
+    _load_builtin_solvers()
+    candidates = [
+        info for info in SOLVERS.values()
+        if (info.optimal or not optimal)
+        and (info.weighted or not weighted)
+        and (info.negative_costs or not negative_costs)
+        and info.complexity <= max_complexity
+        and info.available
+    ]
+    return sorted(candidates, key=lambda info: (info.complexity, info.memory))
+
+def select_solver(maze: Maze, optimal: bool = True, weighted: bool = False, negative_costs: bool = False) -> SolverInfo:
+    """Pick the cheapest registered solver that can handle the maze.
+
+    Memory-mapped mazes are usually too big to hold in memory, so for
+    those the memory class takes precedence over running time.
+    """
+    candidates = eligible_solvers(optimal, weighted, negative_costs=negative_costs)
+    if not candidates:
+        raise ValueError("No registered solver meets the requirements")
+    if maze.mapped:
+        return min(candidates, key=lambda info: (info.memory, info.complexity))
+    return candidates[0]
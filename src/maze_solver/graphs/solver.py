@@ -1,23 +1,29 @@
 # solver.py
+import array
 import textwrap
 import tempfile
 import webbrowser
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict, Set, Tuple
+from typing import Optional, List, Dict, Sequence, Set, Tuple
 import heapq
 import time
 from collections import defaultdict, deque
-import random
 import math
 
 
 from maze_solver.models.border import Border
 from maze_solver.models.maze import Maze
 from maze_solver.models.role import Role
-from maze_solver.models.solution import Solution
+from maze_solver.models.solution import PathSteps, Solution, Steps
 from maze_solver.models.square import Square
-from maze_solver.view.renderer import SVGRenderer
+from maze_solver.graphs.adjacency import DIRECTIONS, OPPOSITE, direction_deltas
+from maze_solver.graphs.colony import ant_colony
+from maze_solver.graphs.distance import distance_field
+from maze_solver.graphs.genetic import evolve
+from maze_solver.graphs.pruning import DeadEnds
+from maze_solver.graphs.registry import Complexity, MemoryClass, get_solver, register
+from maze_solver.view.renderer import SVGRenderer as _SVGRenderer
 from maze_solver.view.primitives import Point, Polyline, Rect, Text, tag
 from maze_solver.view.decomposer import decompose
 
@@ -93,7 +99,7 @@ class SVGRenderer:
             )
         )
 
-    def render_step(self, maze: Maze, step: List[Square]) -> SVG:
+    def render_step(self, maze: Maze, step: Sequence[Square]) -> SVG:
         margins = 2 * (self.offset + self.line_width)
         width = margins + maze.width * self.square_size
         height = margins + maze.height * self.square_size
@@ -117,7 +123,7 @@ class SVGRenderer:
             self._draw_solution(solution) if solution else "",
         ])
 
-    def _get_body_step(self, maze: Maze, step: List[Square]) -> str:
+    def _get_body_step(self, maze: Maze, step: Sequence[Square]) -> str:
         return "".join([
             arrow_marker(),
             background(self.square_size * maze.width, self.square_size * maze.height),
@@ -167,7 +173,7 @@ class SVGRenderer:
             marker_end="url(#arrow)"
         )
 
-    def _draw_solution_step(self, step: List[Square]) -> str:
+    def _draw_solution_step(self, step: Sequence[Square]) -> str:
         return Polyline(
             [
                 self._transform(point, self.square_size // 2)
@@ -232,10 +238,36 @@ def label(emoji: str, top_left: Point, offset: int) -> str:
         dominant_baseline="middle"
     )
 
-def animate_solution(maze: Maze, solution_steps: List[List[Square]], delay: float, direction: str):
+def animate_solution(maze: Maze, solution_steps: Steps, delay: float, direction: str, frames: bool = False):
+    """Open an animation of the solution in the browser.
+
+    By default the maze is drawn once and the path is revealed over it,
+    `delay` seconds per square. With frames=True every step is rendered
+    as its own full SVG, which grows with steps times squares.
+    """
+    if not frames:
+        path = solution_steps[0]
+        svg = _SVGRenderer().render_animation(
+            maze, path, delay * max(len(path) - 1, 1), reveal=direction == "bottom-up"
+        )
+        html_content = textwrap.dedent("""\
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+          <meta charset="utf-8">
+          <meta name="viewport" content="width=device-width, initial-scale=1">
+          <title>SVG Animation</title>
+        </head>
+        <body>
+        """) + svg.xml_content + "\n</body>\n</html>\n"
+        with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", suffix=".html", delete=False) as file:
+            file.write(html_content)
+        webbrowser.open(f"file://{file.name}")
+        return
+
     renderer = SVGRenderer()
     if direction == "bottom-up":
-        solution_steps.reverse()
+        solution_steps = solution_steps[::-1]
     svgs = [renderer.render_step(maze, step).xml_content for step in solution_steps if step]
     html_content = textwrap.dedent(f"""\
     <!DOCTYPE html>
@@ -278,45 +310,7 @@ def animate_solution(maze: Maze, solution_steps: List[List[Square]], delay: floa
 
 def solve_maze_python(maze_path: Path, output_dir: Path, algorithm: str, animation: bool, delay: float, direction: str) -> None:
     maze = Maze.load(maze_path)
-    
-    if algorithm == "bfs":
-        solution_steps = bfs(maze, maze.entrance, maze.exit)
-    elif algorithm == "dfs":
-        solution_steps = dfs(maze, maze.entrance, maze.exit)
-    elif algorithm == "dijkstra":
-        solution_steps = dijkstra(maze, maze.entrance, maze.exit)
-    elif algorithm == "greedy":
-        solution_steps = greedy_best_first(maze, maze.entrance, maze.exit)
-    elif algorithm == "wall-follower":
-        solution_steps = wall_follower(maze, maze.entrance, maze.exit)
-    elif algorithm == "dead-end":
-        solution_steps = dead_end_filling(maze, maze.entrance, maze.exit)
-    elif algorithm == "recursive-bt":
-        solution_steps = recursive_backtracking(maze, maze.entrance, maze.exit)
-    elif algorithm == "a-star":
-        solution_steps = a_star_search_steps(maze, maze.entrance, maze.exit)
-    elif algorithm == "tremaux":
-        solution_steps = tremaux_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "bellman-ford":
-        solution_steps = bellman_ford_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "lee":
-        solution_steps = lee_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "genetic":
-        solution_steps = genetic_algorithm(maze, maze.entrance, maze.exit)
-    elif algorithm == "ant-colony":
-        solution_steps = ant_colony_optimization(maze, maze.entrance, maze.exit)
-    elif algorithm == "best-first":
-        solution_steps = best_first_graph_search(maze, maze.entrance, maze.exit)
-    elif algorithm == "wavefront":
-        solution_steps = wavefront_expansion(maze, maze.entrance, maze.exit)
-    elif algorithm == "jump-point":
-        solution_steps = jump_point_search(maze, maze.entrance, maze.exit)
-    elif algorithm == "fringe":
-        solution_steps = fringe_search(maze, maze.entrance, maze.exit)
-    elif algorithm == "iddfs":
-        solution_steps = iddfs(maze, maze.entrance, maze.exit)
-    else:
-        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    solution_steps = get_solver(algorithm)(maze, maze.entrance, maze.exit)
 
     if solution_steps:
         if animation:
@@ -324,7 +318,7 @@ def solve_maze_python(maze_path: Path, output_dir: Path, algorithm: str, animati
         else:
             renderer = SVGRenderer()
             if direction == "bottom-up":
-                solution_steps.reverse()
+                solution_steps = solution_steps[::-1]
             svg = renderer.render_step(maze, solution_steps[-1])
             svg.preview()
             svg_file_path = output_dir / "solution.svg"
@@ -333,114 +327,197 @@ def solve_maze_python(maze_path: Path, output_dir: Path, algorithm: str, animati
     else:
         print("No solution found")
 
-def a_star_search_steps(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
+@dataclass
+class SearchStats:
+    """Counters filled in by solvers that accept a `stats` argument."""
+    expanded: int = 0
+    heap_pushes: int = 0
+    list_pushes: int = 0
+    iterations: int = 0
+
+@register("a-star", optimal=True, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR, weighted=True)
+def a_star_search_steps(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    cost = maze.adjacency.cost
+    scale = maze.adjacency.min_cost
+    width = maze.width
     open_set = []
-    heapq.heappush(open_set, (0, start))
-    came_from: Dict[Square, Square] = {}
+    heapq.heappush(open_set, (0, start.index))
+    came_from: Dict[int, int] = {}
     
     g_score = defaultdict(lambda: float('inf'))
-    g_score[start] = 0
+    g_score[start.index] = 0
     f_score = defaultdict(lambda: float('inf'))
-    f_score[start] = heuristic(start, goal)
-    
-    open_set_hash = {start}
+    f_score[start.index] = scale * heuristic(start, goal)
     
     while open_set:
-        current = heapq.heappop(open_set)[1]
-        open_set_hash.remove(current)
+        f, current = heapq.heappop(open_set)
+        if f > f_score[current]:
+            continue  # Superseded by a cheaper entry pushed later
         
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
         
-        for neighbor in get_neighbors(maze, current):
-            tentative_g_score = g_score[current] + 1
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
+            tentative_g_score = g_score[current] + cost(current, neighbor)
             
             if tentative_g_score < g_score[neighbor]:
                 came_from[neighbor] = current
                 g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal)
-                if neighbor not in open_set_hash:
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                    open_set_hash.add(neighbor)
+                f_score[neighbor] = g_score[neighbor] + scale * index_heuristic(width, neighbor, goal.index)
+                heapq.heappush(open_set, (f_score[neighbor], neighbor))
+                if stats is not None:
+                    stats.heap_pushes += 1
     
     return None
 
 
-def bfs(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    queue = deque([start])
-    came_from: Dict[Square, Optional[Square]] = {start: None}
+@register("bfs", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR)
+def bfs(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    queue = deque([start.index])
+    came_from: Dict[int, Optional[int]] = {start.index: None}
     
     while queue:
         current = queue.popleft()
         
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
         
-        for neighbor in get_neighbors(maze, current):
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
             if neighbor not in came_from:
                 queue.append(neighbor)
                 came_from[neighbor] = current
     
     return None
 
-def dfs(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    stack = [start]
-    came_from: Dict[Square, Optional[Square]] = {start: None}
+@register("dfs", optimal=False, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR)
+def dfs(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    stack = [start.index]
+    came_from: Dict[int, Optional[int]] = {start.index: None}
     
     while stack:
         current = stack.pop()
         
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
         
-        for neighbor in get_neighbors(maze, current):
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
             if neighbor not in came_from:
                 stack.append(neighbor)
                 came_from[neighbor] = current
     
     return None
 
-def dijkstra(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
+@register("dijkstra", optimal=True, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR, weighted=True)
+def dijkstra(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    cost = maze.adjacency.cost
     open_set = []
-    heapq.heappush(open_set, (0, start))
-    came_from: Dict[Square, Optional[Square]] = {start: None}
+    heapq.heappush(open_set, (0, start.index))
+    came_from: Dict[int, Optional[int]] = {start.index: None}
     cost_so_far = defaultdict(lambda: float('inf'))
-    cost_so_far[start] = 0
+    cost_so_far[start.index] = 0
     
     while open_set:
         current_cost, current = heapq.heappop(open_set)
         
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
         
-        for neighbor in get_neighbors(maze, current):
-            new_cost = cost_so_far[current] + 1  # Assuming uniform cost
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
+            new_cost = cost_so_far[current] + cost(current, neighbor)
             if new_cost < cost_so_far[neighbor]:
                 cost_so_far[neighbor] = new_cost
                 heapq.heappush(open_set, (new_cost, neighbor))
                 came_from[neighbor] = current
+                if stats is not None:
+                    stats.heap_pushes += 1
     
     return None
 
-def greedy_best_first(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
+@register("dial", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR, weighted=True)
+def dial_search(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    """Dijkstra with a bucket queue (Dial's algorithm) for small integer costs.
+
+    Bucket d holds the squares reached at cost d, so the cheapest square
+    is always found by moving forward to the next non-empty bucket. That
+    makes the search O(V + E + C), C being the cost of the path found,
+    with no heap. Costs must be non-negative integers.
+    """
+    neighbors = maze.adjacency.neighbors
+    cost = maze.adjacency.cost
+    goal_index = goal.index
+    came_from: Dict[int, Optional[int]] = {start.index: None}
+    cost_so_far = {start.index: 0}
+    buckets = [[start.index]]
+    distance = 0
+
+    while distance < len(buckets):
+        bucket = buckets[distance]
+        # Zero-cost steps add to the bucket being emptied.
+        while bucket:
+            current = bucket.pop()
+            if cost_so_far[current] != distance:
+                continue  # Superseded by a cheaper entry pushed later
+            if current == goal_index:
+                return reconstruct_index_path(maze, came_from, current)
+
+            if stats is not None:
+                stats.expanded += 1
+            for neighbor in neighbors(current):
+                step = cost(current, neighbor)
+                if step < 0:
+                    raise ValueError("Dial's algorithm needs non-negative costs")
+                new_cost = distance + step
+                if new_cost < cost_so_far.get(neighbor, new_cost + 1):
+                    cost_so_far[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    while len(buckets) <= new_cost:
+                        buckets.append([])
+                    buckets[new_cost].append(neighbor)
+                    if stats is not None:
+                        stats.list_pushes += 1
+        distance += 1
+
+    return None
+
+@register("greedy", optimal=False, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR)
+def greedy_best_first(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    width = maze.width
     open_set = []
-    heapq.heappush(open_set, (heuristic(start, goal), start))
-    came_from: Dict[Square, Optional[Square]] = {start: None}
+    heapq.heappush(open_set, (heuristic(start, goal), start.index))
+    came_from: Dict[int, Optional[int]] = {start.index: None}
     
     while open_set:
         _, current = heapq.heappop(open_set)
         
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
         
-        for neighbor in get_neighbors(maze, current):
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
             if neighbor not in came_from:
-                heapq.heappush(open_set, (heuristic(neighbor, goal), neighbor))
+                heapq.heappush(open_set, (index_heuristic(width, neighbor, goal.index), neighbor))
                 came_from[neighbor] = current
+                if stats is not None:
+                    stats.heap_pushes += 1
     
     return None
 
-def wall_follower(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
+@register("wall-follower", optimal=False, complexity=Complexity.LINEAR, memory=MemoryClass.PATH, grid_only=True)
+def wall_follower(maze: Maze, start: Square, goal: Square) -> Optional[Steps]:
     def turn_left(direction):
         return (-direction[1], direction[0])
 
@@ -488,36 +565,52 @@ def wall_follower(maze: Maze, start: Square, goal: Square) -> Optional[List[List
 
 
 
-def dead_end_filling(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    def is_dead_end(square):
-        return bin(square.border.value).count("1") == 3
-
-    new_squares = list(maze.squares)
-    for square in maze.squares:
-        if is_dead_end(square):
-            new_squares[square.index] = Square(square.index, square.row, square.column, square.border, Role.WALL)
-
-    new_maze = Maze(tuple(new_squares))
-    return a_star_search_steps(new_maze, start, goal)
+@register("dead-end", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR, grid_only=True)
+def dead_end_filling(maze: Maze, start: Square, goal: Square) -> Optional[Steps]:
+    """Fill every dead end except the start and goal, then search what is left.
 
-def recursive_backtracking(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    stack = [(start, [start])]
-    visited = set()
+    In a perfect maze only the solution path survives, so the search
+    just walks along it.
+    """
+    pruned = DeadEnds.find(maze, (start.index, goal.index)).apply(maze)
+    solution_steps = bfs(pruned, pruned.squares[start.index], pruned.squares[goal.index])
+    if solution_steps is None:
+        return None
+    return PathSteps(maze.squares, solution_steps.indices)
+
+@register("recursive-bt", optimal=False, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR)
+def recursive_backtracking(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    """Backtracking search with parent pointers, in O(V + E).
+
+    A square is pushed at most once, by the first square to reach it, so
+    one bitset replaces both the visited set and the scan of the stack.
+    Squares are visited in the same order as before, and the path is read
+    back from the parent pointers instead of copied with every push.
+    """
+    neighbors = maze.adjacency.neighbors
+    goal_index = goal.index
+    pushed = bytearray(len(maze.squares))
+    pushed[start.index] = 1
+    came_from: Dict[int, Optional[int]] = {start.index: None}
+    stack = [start.index]
 
     while stack:
-        current, path = stack.pop()
-        if current == goal:
-            return [path]
-
-        visited.add(current)
-
-        for neighbor in get_neighbors(maze, current):
-            if neighbor not in visited and neighbor not in [p[0] for p in stack]:
-                stack.append((neighbor, path + [neighbor]))
+        current = stack.pop()
+        if current == goal_index:
+            return reconstruct_index_path(maze, came_from, current)
+
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
+            if not pushed[neighbor]:
+                pushed[neighbor] = 1
+                came_from[neighbor] = current
+                stack.append(neighbor)
 
     return None
 
-def tremaux_algorithm(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
+@register("tremaux", optimal=False, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR)
+def tremaux_algorithm(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
     visited = defaultdict(int)
     current = start
     stack = [current]
@@ -530,6 +623,8 @@ def tremaux_algorithm(maze: Maze, start: Square, goal: Square) -> Optional[List[
         if current == goal:
             return [path]
 
+        if stats is not None:
+            stats.expanded += 1
         neighbors = get_neighbors(maze, current)
         unvisited_neighbors = [n for n in neighbors if visited[n] == 0]
 
@@ -542,267 +637,519 @@ def tremaux_algorithm(maze: Maze, start: Square, goal: Square) -> Optional[List[
 
     return None
 
-def bellman_ford_algorithm(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    cost_so_far = defaultdict(lambda: float('inf'))
-    cost_so_far[start] = 0
-    came_from = {start: None}
-    for _ in range(len(maze.squares) - 1):
-        for current in maze.squares:
-            if cost_so_far[current] < float('inf'):
-                for neighbor in get_neighbors(maze, current):
-                    new_cost = cost_so_far[current] + 1
-                    if new_cost < cost_so_far[neighbor]:
-                        cost_so_far[neighbor] = new_cost
-                        came_from[neighbor] = current
-    return reconstruct_path(came_from, goal) if cost_so_far[goal] < float('inf') else None
-
-def lee_algorithm(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    grid = [[float('inf')] * maze.width for _ in range(maze.height)]
-    grid[start.row][start.column] = 0
-    queue = deque([start])
-    came_from = {start: None}
+@register("bellman-ford", optimal=True, complexity=Complexity.QUADRATIC, memory=MemoryClass.LINEAR, weighted=True, negative_costs=True)
+def bellman_ford_algorithm(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    """Queue-based Bellman-Ford (SPFA).
+
+    Only squares whose cost just dropped are relaxed again, and the search
+    ends as soon as a round changes nothing. Costs may be zero or negative;
+    a path of |V| edges can only come from a negative cycle, which makes
+    shortest paths undefined and raises ValueError.
+    """
+    neighbors = maze.adjacency.neighbors
+    cost = maze.adjacency.cost
+    size = len(maze.squares)
+    cost_so_far = {start.index: 0}
+    edge_count = {start.index: 0}
+    came_from: Dict[int, Optional[int]] = {start.index: None}
+    queued = bytearray(size)
+    queue = deque([start.index])
+    queued[start.index] = 1
 
     while queue:
         current = queue.popleft()
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        queued[current] = 0
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
+            new_cost = cost_so_far[current] + cost(current, neighbor)
+            if new_cost < cost_so_far.get(neighbor, float('inf')):
+                cost_so_far[neighbor] = new_cost
+                came_from[neighbor] = current
+                edge_count[neighbor] = edge_count[current] + 1
+                if edge_count[neighbor] >= size:
+                    raise ValueError("Negative cycle reachable from the start")
+                if not queued[neighbor]:
+                    queued[neighbor] = 1
+                    queue.append(neighbor)
+
+    if goal.index not in cost_so_far:
+        return None
+    return reconstruct_index_path(maze, came_from, goal.index)
+
+@register("lee", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR)
+def lee_algorithm(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    grid = [float('inf')] * (maze.width * maze.height)
+    grid[start.index] = 0
+    queue = deque([start.index])
+    came_from: Dict[int, Optional[int]] = {start.index: None}
 
-        for neighbor in get_neighbors(maze, current):
-            if grid[neighbor.row][neighbor.column] == float('inf'):
-                grid[neighbor.row][neighbor.column] = grid[current.row][current.column] + 1
+    while queue:
+        current = queue.popleft()
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
+
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
+            if grid[neighbor] == float('inf'):
+                grid[neighbor] = grid[current] + 1
                 queue.append(neighbor)
                 came_from[neighbor] = current
 
     return None
 
-def genetic_algorithm(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    population_size = 100
-    generations = 10
-    mutation_rate = 0.1
-
-    def random_path(start, goal, maze):
-        current = start
-        path = [current]
-        while current != goal:
-            neighbors = get_neighbors(maze, current)
-            if not neighbors:
-                break
-            current = random.choice(neighbors)
-            path.append(current)
-        return path
-
-    population = [random_path(start, goal, maze) for _ in range(population_size)]
-
-    def fitness(path):
-        if path[-1] != goal:
-            return float('inf')
-        return len(path)
-
-    def crossover(parent1, parent2):
-        crossover_point = random.randint(0, min(len(parent1), len(parent2)) - 1)
-        child1 = parent1[:crossover_point] + parent2[crossover_point:]
-        child2 = parent2[:crossover_point] + parent1[crossover_point:]
-        return child1, child2
-
-    def mutate(path):
-        if random.random() < mutation_rate:
-            mutate_point = random.randint(0, len(path) - 1)
-            neighbors = get_neighbors(maze, path[mutate_point])
-            if neighbors:
-                path[mutate_point] = random.choice(neighbors)
-
-    for generation in range(generations):
-        population = sorted(population, key=fitness)
-        next_population = population[:population_size // 2]
-        for i in range(population_size // 2, population_size, 2):
-            parent1, parent2 = random.sample(next_population, 2)
-            child1, child2 = crossover(parent1, parent2)
-            mutate(child1)
-            mutate(child2)
-            next_population += [child1, child2]
-        population = next_population
-
-    best_path = min(population, key=fitness)
-    return [best_path] if best_path[-1] == goal else None
-
-
-def ant_colony_optimization(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    num_ants = 100
-    num_iterations = 10
-    pheromone_decay = 0.1
-    pheromones = defaultdict(lambda: 1.0)
-
-    def get_path():
-        current = start
-        path = [current]
-        while current != goal:
-            neighbors = get_neighbors(maze, current)
-            probabilities = [pheromones[(current, neighbor)] for neighbor in neighbors]
-            total = sum(probabilities)
-            probabilities = [p / total for p in probabilities]
-            current = random.choices(neighbors, probabilities)[0]
-            path.append(current)
-        return path
+@register("genetic", optimal=False, complexity=Complexity.STOCHASTIC, memory=MemoryClass.LINEAR, grid_only=True, requires=("numpy",))
+def genetic_algorithm(maze: Maze, start: Square, goal: Square) -> Optional[Steps]:
+    """Evolve move sequences with the NumPy engine in graphs/genetic.py.
 
-    def update_pheromones(paths):
-        for path in paths:
-            for i in range(len(path) - 1):
-                pheromones[(path[i], path[i + 1])] += 1.0 / len(path)
-        for edge in pheromones:
-            pheromones[edge] *= (1 - pheromone_decay)
+    Walks have loops erased, so the path returned never revisits a square.
+    """
+    indices = evolve(maze, start.index, goal.index)
+    if indices is None:
+        return None
+    return PathSteps(maze.squares, indices)
 
-    for _ in range(num_iterations):
-        paths = [get_path() for _ in range(num_ants)]
-        update_pheromones(paths)
 
-    best_path = min(paths, key=lambda p: heuristic(p[-1], goal))
-    return [best_path] if best_path[-1] == goal else None
+@register("ant-colony", optimal=False, complexity=Complexity.STOCHASTIC, memory=MemoryClass.LINEAR, grid_only=True, requires=("numpy",))
+def ant_colony_optimization(maze: Maze, start: Square, goal: Square) -> Optional[Steps]:
+    """Ant colony optimization with the NumPy engine in graphs/colony.py."""
+    indices = ant_colony(maze, start.index, goal.index)
+    if indices is None:
+        return None
+    return PathSteps(maze.squares, indices)
 
 
-def best_first_graph_search(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
+@register("best-first", optimal=False, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR)
+def best_first_graph_search(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    width = maze.width
     open_set = []
-    heapq.heappush(open_set, (heuristic(start, goal), start))
-    came_from: Dict[Square, Optional[Square]] = {start: None}
+    heapq.heappush(open_set, (heuristic(start, goal), start.index))
+    came_from: Dict[int, Optional[int]] = {start.index: None}
 
     while open_set:
         _, current = heapq.heappop(open_set)
 
-        if current == goal:
-            return reconstruct_path(came_from, current)
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
 
-        for neighbor in get_neighbors(maze, current):
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
             if neighbor not in came_from:
-                heapq.heappush(open_set, (heuristic(neighbor, goal), neighbor))
+                heapq.heappush(open_set, (index_heuristic(width, neighbor, goal.index), neighbor))
                 came_from[neighbor] = current
+                if stats is not None:
+                    stats.heap_pushes += 1
 
     return None
 
-def wavefront_expansion(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    grid = [[float('inf')] * maze.width for _ in range(maze.height)]
-    grid[start.row][start.column] = 0
-    queue = deque([start])
-    came_from: Dict[Square, Optional[Square]] = {start: None}
+@register("wavefront", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR)
+def wavefront_expansion(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    neighbors = maze.adjacency.neighbors
+    grid = [float('inf')] * (maze.width * maze.height)
+    grid[start.index] = 0
+    queue = deque([start.index])
+    came_from: Dict[int, Optional[int]] = {start.index: None}
 
     while queue:
         current = queue.popleft()
-        if current == goal:
-            return reconstruct_path(came_from, current)
-
-        for neighbor in get_neighbors(maze, current):
-            if grid[neighbor.row][neighbor.column] == float('inf'):
-                grid[neighbor.row][neighbor.column] = grid[current.row][current.column] + 1
+        if current == goal.index:
+            return reconstruct_index_path(maze, came_from, current)
+
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
+            if grid[neighbor] == float('inf'):
+                grid[neighbor] = grid[current] + 1
                 queue.append(neighbor)
                 came_from[neighbor] = current
 
     return None
 
-def jump_point_search(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    open_set = []
-    heapq.heappush(open_set, (0, start))
-    came_from: Dict[Square, Square] = {}
-    
-    g_score = defaultdict(lambda: float('inf'))
-    g_score[start] = 0
-    f_score = defaultdict(lambda: float('inf'))
-    f_score[start] = heuristic(start, goal)
-    
-    open_set_hash = {start}
-    
+@register("distance-field", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR, grid_only=True)
+def distance_field_descent(maze: Maze, start: Square, goal: Square) -> Optional[Steps]:
+    """Follow the cached distance-to-goal field downhill from the start.
+
+    The first query for a goal pays for one full BFS; every later query
+    for the same goal on the same maze costs O(path length).
+    """
+    return distance_field(maze, goal.index).path_from(maze, start.index)
+
+@register("hpa", optimal=True, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR, grid_only=True)
+def hierarchical_search(maze: Maze, start: Square, goal: Square) -> Optional[Steps]:
+    """HPA*: search the maze's cluster graph, then refine inside clusters.
+
+    The cluster graph is built on the first query and cached on the maze,
+    so later queries only pay for the abstract search, a search inside
+    the start and goal clusters and the refinement of each hop.
+    """
+    indices = maze.cluster_graph.search(maze, start.index, goal.index)
+    if indices is None:
+        return None
+    return PathSteps(maze.squares, indices)
+
+@register("jump-point", optimal=True, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR, grid_only=True)
+def jump_point_search(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    """Jump Point Search for 4-connected grids with border walls.
+
+    Horizontal jumps run until the goal or a forced neighbor, i.e. a
+    vertical opening that could not have been reached just as cheaply
+    through the previous square. Vertical jumps additionally scan both
+    ways horizontally from every square they pass. Only jump points are
+    pushed onto the heap; the straight segments between them are filled
+    back in when the path is reconstructed.
+    """
+    mask = maze.adjacency.mask
+    width = maze.width
+    deltas = direction_deltas(width)
+    goal_index = goal.index
+    # Plain ints: masking with Border members goes through the (slow) enum machinery.
+    directions = tuple(map(int, DIRECTIONS))
+    perpendicular = {int(direction): tuple(map(int, sides)) for direction, sides in PERPENDICULAR.items()}
+    vertical_directions = (int(Border.TOP), int(Border.BOTTOM))
+
+    # A jump only depends on where it starts, so every square passed on the
+    # way shares its result. Remembering those keeps repeated scans of the
+    # same rows and columns linear overall.
+    jumps: Dict[int, Dict[int, Optional[int]]] = {direction: {} for direction in directions}
+
+    def jump(current: int, direction: int) -> Optional[int]:
+        delta = deltas[direction]
+        sides = perpendicular[direction]
+        vertical = direction in vertical_directions
+        known = jumps[direction]
+        passed = []
+        jump_point = None
+        while True:
+            if current in known:
+                jump_point = known[current]
+                break
+            if not mask(current) & direction:
+                break
+            passed.append(current)
+            previous, current = current, current + delta
+            if current == goal_index:
+                jump_point = current
+                break
+            current_mask, previous_mask = mask(current), mask(previous)
+            if any(
+                current_mask & side and not (previous_mask & side and mask(previous + deltas[side]) & direction)
+                for side in sides
+            ):
+                jump_point = current
+                break
+            if vertical and any(jump(current, side) is not None for side in sides):
+                jump_point = current
+                break
+        for index in passed:
+            known[index] = jump_point
+        return jump_point
+
+    open_set = [(heuristic(start, goal), start.index)]
+    came_from: Dict[int, Optional[int]] = {start.index: None}
+    g_score = {start.index: 0}
+
     while open_set:
-        current = heapq.heappop(open_set)[1]
-        open_set_hash.remove(current)
-        
-        if current == goal:
-            return reconstruct_path(came_from, current)
-        
-        for neighbor in get_neighbors(maze, current):
-            tentative_g_score = g_score[current] + 1
-            
-            if tentative_g_score < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal)
-                if neighbor not in open_set_hash:
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                    open_set_hash.add(neighbor)
-    
+        f_score, current = heapq.heappop(open_set)
+        if current == goal_index:
+            return reconstruct_jump_path(maze, came_from, current)
+        if f_score > g_score[current] + index_heuristic(width, current, goal_index):
+            continue  # Stale entry
+
+        if stats is not None:
+            stats.expanded += 1
+        parent = came_from[current]
+        backwards = OPPOSITE[direction_between(width, parent, current)] if parent is not None else 0
+        for direction in directions:
+            if direction == backwards or not mask(current) & direction:
+                continue
+            jump_point = jump(current, direction)
+            if jump_point is None:
+                continue
+            tentative_g_score = g_score[current] + index_heuristic(width, current, jump_point)
+            if tentative_g_score < g_score.get(jump_point, float('inf')):
+                came_from[jump_point] = current
+                g_score[jump_point] = tentative_g_score
+                f_score = tentative_g_score + index_heuristic(width, jump_point, goal_index)
+                heapq.heappush(open_set, (f_score, jump_point))
+                if stats is not None:
+                    stats.heap_pushes += 1
+
     return None
 
-def fringe_search(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    open_set = []
-    heapq.heappush(open_set, (0, start))
-    came_from: Dict[Square, Square] = {}
-    
-    g_score = defaultdict(lambda: float('inf'))
-    g_score[start] = 0
-    f_score = defaultdict(lambda: float('inf'))
-    f_score[start] = heuristic(start, goal)
-    
-    open_set_hash = {start}
-    
-    while open_set:
-        current = heapq.heappop(open_set)[1]
-        open_set_hash.remove(current)
-        
-        if current == goal:
-            return reconstruct_path(came_from, current)
-        
-        for neighbor in get_neighbors(maze, current):
-            tentative_g_score = g_score[current] + 1
-            
-            if tentative_g_score < g_score[neighbor]:
-                came_from[neighbor] = current
+def direction_between(width: int, source: int, target: int) -> Border:
+    """Direction of a straight move from source to target."""
+    if source // width == target // width:
+        return Border.RIGHT if target > source else Border.LEFT
+    return Border.BOTTOM if target > source else Border.TOP
+
+def reconstruct_jump_path(maze: Maze, came_from: Dict[int, Optional[int]], current: int) -> PathSteps:
+    deltas = direction_deltas(maze.width)
+    indices = array.array("L", [current])
+    while (parent := came_from[current]) is not None:
+        delta = deltas[direction_between(maze.width, current, parent)]
+        indices.extend(range(current + delta, parent + delta, delta))
+        current = parent
+    return PathSteps(maze.squares, indices)
+
+@register("fringe", optimal=True, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR, weighted=True)
+def fringe_search(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    """Fringe Search: IDA*-style f-thresholds over a fringe, without a heap.
+
+    Squares whose f-value is within the threshold are expanded depth-first
+    from the `now` list; the rest are parked on `later` and revisited with
+    the smallest f that exceeded the threshold. g-values and parents live
+    in a cache, so nothing is re-expanded from scratch between iterations.
+    Pass a SearchStats to compare list pushes here with the heap pushes
+    counted by a_star_search_steps().
+    """
+    neighbors = maze.adjacency.neighbors
+    cost = maze.adjacency.cost
+    scale = maze.adjacency.min_cost
+    width = maze.width
+    goal_index = goal.index
+    came_from: Dict[int, Optional[int]] = {start.index: None}
+    g_score = {start.index: 0}
+    # A square moves within the fringe by being pushed again; older
+    # entries are recognised by a stale version and skipped.
+    version = {start.index: 0}
+    later = [(start.index, 0)]
+    f_limit = scale * heuristic(start, goal)
+
+    while later:
+        now = later[::-1]
+        later = []
+        f_min = float('inf')
+        if stats is not None:
+            stats.iterations += 1
+        while now:
+            current, current_version = now.pop()
+            if version[current] != current_version:
+                continue
+            f_score = g_score[current] + scale * index_heuristic(width, current, goal_index)
+            if f_score > f_limit:
+                f_min = min(f_min, f_score)
+                later.append((current, current_version))
+                continue
+            if current == goal_index:
+                return reconstruct_index_path(maze, came_from, current)
+
+            version[current] += 1  # Expanded, so it leaves the fringe.
+            if stats is not None:
+                stats.expanded += 1
+            for neighbor in reversed(neighbors(current)):
+                tentative_g_score = g_score[current] + cost(current, neighbor)
+                if tentative_g_score >= g_score.get(neighbor, float('inf')):
+                    continue
                 g_score[neighbor] = tentative_g_score
-                f_score[neighbor] = g_score[neighbor] + heuristic(neighbor, goal)
-                if neighbor not in open_set_hash:
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                    open_set_hash.add(neighbor)
-    
+                came_from[neighbor] = current
+                version[neighbor] = version.get(neighbor, 0) + 1
+                now.append((neighbor, version[neighbor]))
+                if stats is not None:
+                    stats.list_pushes += 1
+        f_limit = f_min
+
     return None
 
-def iddfs(maze: Maze, start: Square, goal: Square) -> Optional[List[List[Square]]]:
-    def dls(node, depth, came_from):
-        if depth == 0:
-            return node == goal
-        if depth > 0:
-            for neighbor in get_neighbors(maze, node):
-                if neighbor not in came_from:  # Avoid cycles
-                    came_from[neighbor] = node
-                    if dls(neighbor, depth - 1, came_from):
-                        return True
-        return False
+@register("iddfs", optimal=True, complexity=Complexity.EXPONENTIAL, memory=MemoryClass.LINEAR)
+def iddfs(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    """Iterative deepening DFS with an explicit stack.
+
+    Depth limits double every round, so a path of length d takes
+    O(log d) rounds. Once a round reaches the goal it keeps going with the
+    limit cut below the best path so far, which makes the result a
+    shortest path. Only the current path is stored, plus a bitset of the
+    squares on it for cycle checks. Open areas with many loops make each
+    round exponential, as in any depth-limited search, hence its
+    complexity class; on perfect mazes each round is linear.
+    """
+    neighbors = maze.adjacency.neighbors
+    goal_index = goal.index
+    on_path = bytearray(len(maze.squares))
+    limit = 1
+
+    while True:
+        if stats is not None:
+            stats.iterations += 1
+        best = None
+        bound = limit  # Most edges a path may have.
+        cut_off = False
+        path = [start.index]
+        # Unexplored neighbors per path square, reversed so pop() keeps order.
+        pending = [neighbors(start.index)[::-1]]
+        on_path[start.index] = 1
+
+        while path:
+            current = path[-1]
+            if current == goal_index or not pending[-1]:
+                if current == goal_index:
+                    best = array.array("L", reversed(path))
+                    bound = len(path) - 2
+                on_path[current] = 0
+                path.pop()
+                pending.pop()
+                continue
+            neighbor = pending[-1].pop()
+            if on_path[neighbor]:
+                continue
+            if len(path) > bound:
+                cut_off = True
+                continue
+            path.append(neighbor)
+            pending.append(neighbors(neighbor)[::-1])
+            on_path[neighbor] = 1
+            if stats is not None:
+                stats.expanded += 1
+
+        if best is not None:
+            return PathSteps(maze.squares, best)
+        if not cut_off:
+            return None
+        limit *= 2
+
+@register("bidirectional-bfs", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.LINEAR)
+def bidirectional_bfs(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    if start.index == goal.index:
+        return reconstruct_index_path(maze, {}, goal.index)
+
+    neighbors = maze.adjacency.neighbors
+    forward = ([start.index], {start.index: None}, {start.index: 0})
+    backward = ([goal.index], {goal.index: None}, {goal.index: 0})
+
+    while forward[0] and backward[0]:
+        # Grow the smaller frontier by one full layer. The first layer that
+        # touches the other side contains a shortest connection.
+        if len(forward[0]) <= len(backward[0]):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+        frontier, came_from, distance = side
+        _, other_came_from, other_distance = other
+
+        next_frontier = []
+        best_length, meeting = float('inf'), None
+        if stats is not None:
+            stats.expanded += len(frontier)
+        for current in frontier:
+            for neighbor in neighbors(current):
+                if neighbor in other_distance:
+                    length = distance[current] + 1 + other_distance[neighbor]
+                    if length < best_length:
+                        best_length, meeting = length, (current, neighbor)
+                if neighbor not in came_from:
+                    came_from[neighbor] = current
+                    distance[neighbor] = distance[current] + 1
+                    next_frontier.append(neighbor)
+        if meeting:
+            if side is forward:
+                return reconstruct_bidirectional_path(maze, came_from, meeting[0], other_came_from, meeting[1])
+            return reconstruct_bidirectional_path(maze, other_came_from, meeting[1], came_from, meeting[0])
+        side[0][:] = next_frontier
 
-    for depth in range(len(maze.squares)):
-        came_from = {start: None}
-        if dls(start, depth, came_from):
-            return reconstruct_path(came_from, goal)
     return None
 
-def reconstruct_path(came_from: Dict[Square, Square], current: Square) -> List[List[Square]]:
-    total_path = [current]
-    path_steps = [total_path[:]]
-    while current in came_from:
-        current = came_from[current]
-        total_path.append(current)
-        path_steps.append(total_path[:])
-    path_steps.reverse()
-    return path_steps
+@register("bidirectional-a-star", optimal=True, complexity=Complexity.LINEARITHMIC, memory=MemoryClass.LINEAR, weighted=True)
+def bidirectional_a_star(maze: Maze, start: Square, goal: Square, stats: Optional[SearchStats] = None) -> Optional[Steps]:
+    if start.index == goal.index:
+        return reconstruct_index_path(maze, {}, goal.index)
+
+    neighbors = maze.adjacency.neighbors
+    cost = maze.adjacency.cost
+    scale = maze.adjacency.min_cost
+    width = maze.width
+
+    # Both directions use the averaged potential p(v) = (h_goal(v) - h_start(v)) / 2
+    # (negated for the backward search), which keeps both searches consistent
+    # so the usual bidirectional Dijkstra stopping rule stays exact. Keys are
+    # doubled to stay in integers.
+    def potential(index: int) -> int:
+        return scale * (index_heuristic(width, index, goal.index) - index_heuristic(width, index, start.index))
+
+    forward = ([(potential(start.index), start.index)], {start.index: None}, {start.index: 0}, 1)
+    backward = ([(-potential(goal.index), goal.index)], {goal.index: None}, {goal.index: 0}, -1)
+    best_length, meeting = float('inf'), None
+
+    while forward[0] and backward[0]:
+        if forward[0][0][0] + backward[0][0][0] >= 2 * best_length:
+            break
+        side, other = (forward, backward) if forward[0][0][0] <= backward[0][0][0] else (backward, forward)
+        open_set, came_from, g_score, sign = side
+        other_g_score = other[2]
+
+        key, current = heapq.heappop(open_set)
+        if key != 2 * g_score[current] + sign * potential(current):
+            continue  # Stale entry, the square was reached more cheaply since.
+
+        if stats is not None:
+            stats.expanded += 1
+        for neighbor in neighbors(current):
+            # The backward search walks edges against their direction, so
+            # it pays for the step neighbor -> current. Forward g-scores then
+            # include the square they reach and backward ones exclude it,
+            # which counts the meeting square exactly once.
+            step = cost(current, neighbor) if side is forward else cost(neighbor, current)
+            tentative_g_score = g_score[current] + step
+            if tentative_g_score < g_score.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                heapq.heappush(open_set, (2 * tentative_g_score + sign * potential(neighbor), neighbor))
+                if stats is not None:
+                    stats.heap_pushes += 1
+            if neighbor in other_g_score:
+                length = tentative_g_score + other_g_score[neighbor]
+                if length < best_length:
+                    best_length = length
+                    meeting = (current, neighbor) if side is forward else (neighbor, current)
+
+    if meeting is None:
+        return None
+    return reconstruct_bidirectional_path(maze, forward[1], meeting[0], backward[1], meeting[1])
+
+def reconstruct_index_path(maze: Maze, came_from: Dict[int, Optional[int]], current: int) -> PathSteps:
+    indices = array.array("L", [current])
+    while (current := came_from.get(current)) is not None:
+        indices.append(current)
+    return PathSteps(maze.squares, indices)
+
+def reconstruct_bidirectional_path(
+    maze: Maze,
+    forward_came_from: Dict[int, Optional[int]],
+    forward_end: int,
+    backward_came_from: Dict[int, Optional[int]],
+    backward_end: int,
+) -> PathSteps:
+    """Join two half paths meeting at the edge forward_end -> backward_end."""
+    to_start = array.array("L")
+    current = forward_end
+    while current is not None:
+        to_start.append(current)
+        current = forward_came_from[current]
+    to_goal = array.array("L")
+    current = backward_end
+    while current is not None:
+        to_goal.append(current)
+        current = backward_came_from[current]
+    to_goal.reverse()
+    return PathSteps(maze.squares, to_goal + to_start)
+
+PERPENDICULAR = {
+    Border.TOP: (Border.LEFT, Border.RIGHT),
+    Border.BOTTOM: (Border.LEFT, Border.RIGHT),
+    Border.LEFT: (Border.TOP, Border.BOTTOM),
+    Border.RIGHT: (Border.TOP, Border.BOTTOM),
+}
 
 def get_neighbors(maze: Maze, square: Square) -> List[Square]:
-    neighbors = []
-    directions = [
-        (0, -1, Border.TOP, Border.BOTTOM),
-        (1, 0, Border.RIGHT, Border.LEFT),
-        (0, 1, Border.BOTTOM, Border.TOP),
-        (-1, 0, Border.LEFT, Border.RIGHT),
-    ]
-    for dx, dy, own_border, neighbor_border in directions:
-        nx, ny = square.column + dx, square.row + dy
-        if 0 <= nx < maze.width and 0 <= ny < maze.height:
-            neighbor = maze.squares[ny * maze.width + nx]
-            if not (square.border & own_border) and not (neighbor.border & neighbor_border):
-                neighbors.append(neighbor)
-    return neighbors
+    squares = maze.squares
+    return [squares[index] for index in maze.adjacency.neighbors(square.index)]
 
 def heuristic(a: Square, b: Square) -> int:
-    return abs(a.row - b.row) + abs(a.column - b.column)
\ No newline at end of file
+    return abs(a.row - b.row) + abs(a.column - b.column)
+
+def index_heuristic(width: int, a: int, b: int) -> int:
+    a_row, a_column = divmod(a, width)
+    b_row, b_column = divmod(b, width)
+    return abs(a_row - b_row) + abs(a_column - b_column)
\ No newline at end of file
@@ -0,0 +1,65 @@
+# weights.py
+import array
+from typing import Union
+
+from maze_solver.models.maze import Maze
+from maze_solver.models.role import Role
+from maze_solver.persistence.serializer import decode_planes
+
+# Taken off the cost of stepping onto a reward, added to stepping onto an enemy.
+DEFAULT_BONUS = 1
+DEFAULT_PENALTY = 2
+
+def role_cost(role: int, bonus: int = DEFAULT_BONUS, penalty: int = DEFAULT_PENALTY) -> int:
+    """Cost of a single step onto a square with the given role."""
+    if role == Role.REWARD:
+        return 1 - bonus
+    if role == Role.ENEMY:
+        return 1 + penalty
+    return 1
+
+def square_costs(maze: Maze, bonus: int = DEFAULT_BONUS, penalty: int = DEFAULT_PENALTY) -> array.array:
+    """Cost of stepping onto each square, read off the role plane."""
+    roles = decode_planes(maze.square_values)[1]
+    table = [role_cost(role, bonus, penalty) for role in range(256)]
+    if 0 <= min(table) and max(table) <= 0xff:
+        return array.array("B", roles.translate(bytes(table)))
+    # Negative or large costs don't fit a byte table.
+    return array.array("i", map(table.__getitem__, roles))
+
+class WeightedAdjacency:
+    """Adjacency charging every step the cost of the square it enters.
+
+    Neighbors come from the wrapped adjacency unchanged; only cost()
+    differs, so every solver calling it honours the role costs.
+    """
+
+    def __init__(self, adjacency, costs: array.array) -> None:
+        self._adjacency = adjacency
+        self.costs = costs
+        # Free (or negative) steps leave nothing for a heuristic to count.
+        self.min_cost = max(min(costs, default=1), 0)
+
+    def __getattr__(self, name: str):
+        return getattr(self._adjacency, name)
+
+    def cost(self, source: int, target: int) -> int:
+        return self.costs[target]
+
+class WeightedMaze:
+    """Stand-in for a maze whose steps cost what their target role says."""
+
+    def __init__(self, maze: Maze, adjacency: WeightedAdjacency) -> None:
+        self.maze = maze
+        self.width = maze.width
+        self.height = maze.height
+        self.squares = maze.squares
+        self.adjacency = adjacency
+
+def weighted_maze(
+    maze: Maze, bonus: int = DEFAULT_BONUS, penalty: int = DEFAULT_PENALTY
+) -> Union[Maze, WeightedMaze]:
+    """The maze with role costs applied, or the maze itself if every step costs 1."""
+    if bonus == 0 and penalty == 0:
+        return maze
+    return WeightedMaze(maze, WeightedAdjacency(maze.adjacency, square_costs(maze, bonus, penalty)))
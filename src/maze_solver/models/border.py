@@ -7,3 +7,20 @@ class Border(IntFlag):
     RIGHT = 2
     BOTTOM = 4
     LEFT = 8
+
+    @property
+    def corner(self) -> bool:
+        return self in (
+            self.TOP | self.LEFT,
+            self.TOP | self.RIGHT,
+            self.BOTTOM | self.LEFT,
+            self.BOTTOM | self.RIGHT,
+        )
+
+    @property
+    def dead_end(self) -> bool:
+        return bin(self.value).count("1") == 3
+
+    @property
+    def intersection(self) -> bool:
+        return bin(self.value).count("1") < 2
@@ -1,49 +1,128 @@
 # maze.py
-from dataclasses import dataclass
+import array
+import hashlib
+from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
 import pathlib
-from typing import List, Iterator
+from typing import TYPE_CHECKING, Iterator, Sequence, Union, overload
 
 from maze_solver.models.role import Role
 from maze_solver.models.square import Square
-from maze_solver.persistence.serializer import load_squares
+from maze_solver.persistence.serializer import (
+    BORDERS, ROLES, decode_planes, decompress, encode_planes, load_values, map_values
+)
+
+if TYPE_CHECKING:
+    from maze_solver.graphs.adjacency import Adjacency, LazyAdjacency
+    from maze_solver.graphs.converter import JunctionGraph
+    from maze_solver.graphs.hierarchy import ClusterGraph
+
+class SquareView(Sequence[Square]):
+    """Read-only sequence of squares decoded on demand from packed square values."""
+
+    __slots__ = ("_square_values", "_width")
+
+    def __init__(self, square_values: Sequence[int], width: int) -> None:
+        self._square_values = square_values
+        self._width = width
+
+    @property
+    def square_values(self) -> Sequence[int]:
+        return self._square_values
+
+    def __len__(self) -> int:
+        return len(self._square_values)
+
+    @overload
+    def __getitem__(self, index: int) -> Square: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Square]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Square, Sequence[Square]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._square_values)
+        border, role = decompress(self._square_values[index])
+        row, column = divmod(index, self._width)
+        return Square(index, row, column, border, role)
+
+    def __iter__(self) -> Iterator[Square]:
+        width = self._width
+        borders, roles = decode_planes(self._square_values)
+        for index, (border, role) in enumerate(zip(borders, roles)):
+            row, column = divmod(index, width)
+            yield Square(index, row, column, BORDERS[border], ROLES[role])
 
 @dataclass(frozen=True)
 class Maze:
-    squares: List[Square]
+    width: int
+    height: int
+    square_values: Union[array.array, memoryview]
+    mapped: bool = field(default=False, compare=False)
+
+    @classmethod
+    def from_squares(cls, squares: Sequence[Square]) -> "Maze":
+        width = max(square.column for square in squares) + 1
+        height = max(square.row for square in squares) + 1
+        borders = bytearray(width * height)
+        roles = bytearray(width * height)
+        for square in squares:
+            borders[square.index] = square.border
+            roles[square.index] = square.role
+        return cls(width, height, encode_planes(borders, roles))
 
     @classmethod
     def load(cls, path: pathlib.Path) -> "Maze":
         print(f"Loading maze from {path}")
-        squares = list(load_squares(path))
-        print(f"Loaded {len(squares)} squares")
-        if not squares:
+        header, body = load_values(path)
+        if not body.square_values:
+            raise ValueError("No squares loaded from the file")
+        print(f"Loaded maze dimensions: {header.width}x{header.height}")
+        return cls(header.width, header.height, body.square_values)
+
+    @classmethod
+    def open(cls, path: pathlib.Path) -> "Maze":
+        """Memory-map a maze file; squares are decoded only when accessed."""
+        header, body = map_values(path)
+        if not body.square_values:
             raise ValueError("No squares loaded from the file")
-        
-        # Calculate width and height based on the number of squares
-        total_squares = len(squares)
-        width = int(total_squares**0.5)  # Assuming it's a square maze
-        height = total_squares // width
-        
-        print(f"Calculated maze dimensions: {width}x{height}")
-        entrance = next((s for s in squares if s.role == Role.ENTRANCE), None)
-        exit = next((s for s in squares if s.role == Role.EXIT), None)
-        print(f"Entrance: {entrance}")
-        print(f"Exit: {exit}")
-        return cls(tuple(squares))
+        return cls(header.width, header.height, body.square_values, mapped=True)
 
     def dump(self, path: Path) -> None:
-        from maze_solver.persistence.serializer import dump_squares
-        dump_squares(self.width, self.height, self.squares, path)
+        from maze_solver.persistence.serializer import dump_values
+        dump_values(self.width, self.height, self.square_values, path)
+
+    @cached_property
+    def squares(self) -> SquareView:
+        return SquareView(self.square_values, self.width)
+
+    @cached_property
+    def adjacency(self) -> Union["Adjacency", "LazyAdjacency"]:
+        from maze_solver.graphs.adjacency import Adjacency, LazyAdjacency
+        if self.mapped:
+            return LazyAdjacency(self.width, self.height, self.square_values)
+        return Adjacency.build(self.width, self.height, self.square_values)
+
+    @cached_property
+    def junction_graph(self) -> "JunctionGraph":
+        from maze_solver.graphs.converter import JunctionGraph
+        return JunctionGraph.build(self)
 
     @cached_property
-    def width(self) -> int:
-        return max(square.column for square in self.squares) + 1
+    def cluster_graph(self) -> "ClusterGraph":
+        from maze_solver.graphs.hierarchy import ClusterGraph
+        return ClusterGraph.build(self)
 
     @cached_property
-    def height(self) -> int:
-        return max(square.row for square in self.squares) + 1
+    def digest(self) -> str:
+        """Hash of the maze contents, for keying caches derived from them."""
+        content = hashlib.blake2b(digest_size=16)
+        content.update(f"{self.width}x{self.height}:".encode())
+        content.update(self.square_values)
+        return content.hexdigest()
 
     @cached_property
     def entrance(self) -> Square:
@@ -51,12 +130,16 @@ class Maze:
 
     @cached_property
     def exit(self) -> Square:
-        return self._get_square_by_role(Role.EXIT)
+        # The loader always puts the exit on the last square, so search
+        # backwards to avoid paging in the whole of a mapped maze.
+        return self._get_square_by_role(Role.EXIT, reverse=True)
 
-    def _get_square_by_role(self, role: Role) -> Square:
-        for square in self.squares:
-            if square.role is role:
-                return square
+    def _get_square_by_role(self, role: Role, reverse: bool = False) -> Square:
+        square_values = self.square_values
+        indices = range(len(square_values))
+        for index in reversed(indices) if reverse else indices:
+            if square_values[index] >> 4 == role:
+                return self.squares[index]
         raise ValueError(f"No square with role {role}")
 
     def __iter__(self) -> Iterator[Square]:
@@ -1,6 +1,7 @@
 # solution.py
+import array
 from dataclasses import dataclass
-from typing import Iterator, List
+from typing import Iterator, List, Sequence, Union, overload
 
 from maze_solver.models.square import Square
 
@@ -13,3 +14,72 @@ class Solution:
 
     def __iter__(self) -> Iterator[Square]:
         return iter(self.squares)
+
+class PathPrefix(Sequence[Square]):
+    """The first `length` squares of a path, decoded on access."""
+
+    __slots__ = ("_squares", "_indices", "_length")
+
+    def __init__(self, squares: Sequence[Square], indices: array.array, length: int) -> None:
+        self._squares = squares
+        self._indices = indices
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Square: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Square]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Square, List[Square]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("path index out of range")
+        return self._squares[self._indices[index]]
+
+    def __iter__(self) -> Iterator[Square]:
+        squares, indices = self._squares, self._indices
+        for position in range(self._length):
+            yield squares[indices[position]]
+
+class PathSteps(Sequence[PathPrefix]):
+    """Solution steps backed by a single array of square indices.
+
+    The path is stored once, goal first. Step k is the prefix holding all
+    but the last k squares, so step 0 is the complete path and the last
+    step is the goal alone. This keeps the old list-of-prefixes shape
+    without copying the path at every step.
+    """
+
+    __slots__ = ("_squares", "indices")
+
+    def __init__(self, squares: Sequence[Square], indices: array.array) -> None:
+        self._squares = squares
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, step: int) -> PathPrefix: ...
+
+    @overload
+    def __getitem__(self, step: slice) -> List[PathPrefix]: ...
+
+    def __getitem__(self, step: Union[int, slice]) -> Union[PathPrefix, List[PathPrefix]]:
+        if isinstance(step, slice):
+            return [self[i] for i in range(*step.indices(len(self)))]
+        if step < 0:
+            step += len(self)
+        if not 0 <= step < len(self):
+            raise IndexError("step index out of range")
+        return PathPrefix(self._squares, self.indices, len(self) - step)
+
+# What solvers return: either PathSteps or a plain list of square lists.
+Steps = Sequence[Sequence[Square]]
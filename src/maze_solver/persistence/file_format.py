@@ -26,12 +26,13 @@ class FileHeader:
         file.write(struct.pack("<2I", self.width, self.height))
 
 import array
+import mmap
 from dataclasses import dataclass
-from typing import BinaryIO
+from typing import BinaryIO, Union
 
 @dataclass(frozen=True)
 class FileBody:
-    square_values: array.array
+    square_values: Union[array.array, memoryview]
 
     @classmethod
     def read(cls, header: FileHeader, file: BinaryIO) -> "FileBody":
@@ -39,5 +40,16 @@ class FileBody:
             array.array("B", file.read(header.width * header.height))
         )
 
+    @classmethod
+    def map(cls, header: FileHeader, file: BinaryIO) -> "FileBody":
+        # Copy-on-write mapping: pages are read from disk on first access
+        # and any patched square stays private to this process.
+        offset = file.tell()
+        size = header.width * header.height
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(mapping) < offset + size:
+            raise ValueError("Truncated maze file")
+        return cls(memoryview(mapping)[offset:offset + size])
+
     def write(self, file: BinaryIO) -> None:
         file.write(self.square_values.tobytes())
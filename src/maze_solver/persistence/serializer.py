@@ -1,7 +1,7 @@
 # serializer.py
 import array
 import pathlib
-from typing import Iterator
+from typing import BinaryIO, Iterator, MutableSequence, Sequence
 
 from maze_solver.models.border import Border
 from maze_solver.models.role import Role
@@ -10,42 +10,92 @@ from maze_solver.persistence.file_format import FileBody, FileHeader
 
 FORMAT_VERSION: int = 1
 
+# Enum members indexed by their value, so decoding never calls the
+# (slow) Border(...) / Role(...) constructors.
+BORDERS: tuple[Border, ...] = tuple(Border(value) for value in range(16))
+ROLES: tuple[Role, ...] = tuple(Role(value) for value in range(len(Role)))
+
+# bytes.translate() tables splitting a packed square value into its planes.
+BORDER_PLANE: bytes = bytes(value & 0xf for value in range(256))
+ROLE_PLANE: bytes = bytes(value >> 4 for value in range(256))
+ROLE_SHIFT: bytes = bytes((value << 4) & 0xff for value in range(256))
+
 def compress(square: Square) -> int:
     return (square.role << 4) | square.border.value
 
 def decompress(square_value: int) -> tuple[Border, Role]:
-    return Border(square_value & 0xf), Role(square_value >> 4)
+    return BORDERS[square_value & 0xf], ROLES[square_value >> 4]
+
+def encode_planes(borders: bytes, roles: bytes) -> array.array:
+    """Pack a border plane and a role plane into square values in one pass."""
+    size = len(borders)
+    packed = (
+        int.from_bytes(borders, "little")
+        | int.from_bytes(roles.translate(ROLE_SHIFT), "little")
+    )
+    return array.array("B", packed.to_bytes(size, "little"))
 
-def serialize(width: int, height: int, squares: tuple[Square, ...]) -> tuple[FileHeader, FileBody]:
+def decode_planes(square_values: Sequence[int]) -> tuple[bytes, bytes]:
+    """Split square values into a border plane and a role plane."""
+    square_bytes = bytes(square_values)
+    return square_bytes.translate(BORDER_PLANE), square_bytes.translate(ROLE_PLANE)
+
+def serialize(width: int, height: int, squares: Sequence[Square]) -> tuple[FileHeader, FileBody]:
     header = FileHeader(FORMAT_VERSION, width, height)
-    body = FileBody(array.array("B", map(compress, squares)))
-    return header, body
+    square_values = getattr(squares, "square_values", None)
+    if square_values is not None:
+        # Already packed (e.g. Maze.squares), no need to re-encode.
+        return header, FileBody(array.array("B", square_values))
+    borders = bytes(square.border for square in squares)
+    roles = bytes(square.role for square in squares)
+    return header, FileBody(encode_planes(borders, roles))
 
-def dump_squares(width: int, height: int, squares: tuple[Square, ...], path: pathlib.Path) -> None:
+def dump_squares(width: int, height: int, squares: Sequence[Square], path: pathlib.Path) -> None:
     header, body = serialize(width, height, squares)
     with path.open(mode="wb") as file:
         header.write(file)
         body.write(file)
 
-def load_squares(path: pathlib.Path) -> Iterator[Square]:
+def dump_values(width: int, height: int, square_values: array.array, path: pathlib.Path) -> None:
+    header = FileHeader(FORMAT_VERSION, width, height)
+    with path.open(mode="wb") as file:
+        header.write(file)
+        FileBody(square_values).write(file)
+
+def load_values(path: pathlib.Path) -> tuple[FileHeader, FileBody]:
     print(f"Attempting to load maze from {path}")
     with path.open("rb") as file:
-        header = FileHeader.read(file)
-        if header.format_version != FORMAT_VERSION:
-            raise ValueError(f"Unsupported file format version: {header.format_version}")
+        header = read_header(file)
         body = FileBody.read(header, file)
-        squares = list(deserialize(header, body))
-        
-        # Ensure entrance and exit are set
-        if squares[0].role != Role.ENTRANCE:
-            squares[0] = Square(squares[0].index, squares[0].row, squares[0].column, squares[0].border, Role.ENTRANCE)
-        if squares[-1].role != Role.EXIT:
-            squares[-1] = Square(squares[-1].index, squares[-1].row, squares[-1].column, squares[-1].border, Role.EXIT)
-        
-        return iter(squares)
+    ensure_entrance_and_exit(body.square_values)
+    return header, body
+
+def map_values(path: pathlib.Path) -> tuple[FileHeader, FileBody]:
+    with path.open("rb") as file:
+        header = read_header(file)
+        body = FileBody.map(header, file)
+    ensure_entrance_and_exit(body.square_values)
+    return header, body
+
+def read_header(file: BinaryIO) -> FileHeader:
+    header = FileHeader.read(file)
+    if header.format_version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported file format version: {header.format_version}")
+    return header
+
+def ensure_entrance_and_exit(square_values: MutableSequence[int]) -> None:
+    if square_values:
+        if square_values[0] >> 4 != Role.ENTRANCE:
+            square_values[0] = (Role.ENTRANCE << 4) | (square_values[0] & 0xf)
+        if square_values[-1] >> 4 != Role.EXIT:
+            square_values[-1] = (Role.EXIT << 4) | (square_values[-1] & 0xf)
+
+def load_squares(path: pathlib.Path) -> Iterator[Square]:
+    header, body = load_values(path)
+    return deserialize(header, body)
 
 def deserialize(header: FileHeader, body: FileBody) -> Iterator[Square]:
-    for index, square_value in enumerate(body.square_values):
+    borders, roles = decode_planes(body.square_values)
+    for index, (border, role) in enumerate(zip(borders, roles)):
         row, column = divmod(index, header.width)
-        border, role = decompress(square_value)
-        yield Square(index, row, column, border, role)
+        yield Square(index, row, column, BORDERS[border], ROLES[role])
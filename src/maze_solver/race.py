@@ -0,0 +1,120 @@
+# race.py
+import array
+import multiprocessing
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Optional, Sequence, Tuple
+
+from maze_solver.graphs.registry import Complexity, SolverInfo, get_solver
+from maze_solver.models.maze import Maze
+from maze_solver.models.solution import PathSteps
+from maze_solver.models.square import Square
+
+DEFAULT_ENTRANTS = ("bfs", "a-star", "greedy", "bidirectional-bfs")
+
+# Seconds between checks for workers that died without posting a result.
+POLL_INTERVAL = 0.1
+
+def race(
+    maze: Maze,
+    start: Square,
+    goal: Square,
+    solvers: Sequence[SolverInfo],
+    optimal: bool = False,
+    timeout: Optional[float] = None,
+) -> Tuple[Optional[SolverInfo], Optional[PathSteps]]:
+    """Run solvers in parallel processes and keep the first good answer.
+
+    With optimal=True only solvers registered as optimal take part, so
+    the first answer is also a shortest one. Paths are checked before
+    they are accepted, and the losing processes are terminated. Returns
+    the winning solver and its steps, or (None, None) if nobody finished
+    within `timeout` seconds, or every worker exited (even if killed)
+    without a good answer.
+
+    The maze lives in shared memory, so every worker reads the same copy.
+    """
+    entrants = [solver for solver in solvers if solver.optimal or not optimal]
+    if not entrants:
+        raise ValueError("No solver in the race meets the requirements")
+
+    size = len(maze.square_values)
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    memory.buf[:size] = bytes(maze.square_values)
+    results = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=run_entrant,
+            args=(memory.name, maze.width, maze.height, solver.name, start.index, goal.index, results),
+            daemon=True,
+        )
+        for solver in entrants
+    ]
+    try:
+        for worker in workers:
+            worker.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = len(workers)
+        while pending:
+            try:
+                name, indices, failed = results.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                if not any(worker.is_alive() for worker in workers) and results.empty():
+                    break  # Everyone left has died without posting a result.
+                continue
+            pending -= 1
+            solver = get_solver(name)
+            if failed:
+                continue
+            if indices is None:
+                # Only a complete search can prove there is no path.
+                if solver.complexity != Complexity.STOCHASTIC:
+                    return solver, None
+            elif is_valid_path(maze, indices, start.index, goal.index):
+                return solver, PathSteps(maze.squares, indices)
+        return None, None
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in workers:
+            worker.join()
+        memory.close()
+        memory.unlink()
+
+def run_entrant(
+    memory_name: str,
+    width: int,
+    height: int,
+    name: str,
+    start: int,
+    goal: int,
+    results: "multiprocessing.Queue",
+) -> None:
+    memory = shared_memory.SharedMemory(name=memory_name)
+    try:
+        maze = Maze(width, height, memory.buf[:width * height])
+        solution_steps = get_solver(name)(maze, maze.squares[start], maze.squares[goal])
+        indices = None
+        if solution_steps:
+            indices = array.array("L", (square.index for square in solution_steps[0]))
+            if indices[0] != goal:
+                indices.reverse()
+        results.put((name, indices, False))
+    except Exception:
+        results.put((name, None, True))
+        raise
+    finally:
+        # Drop every view of the buffer before closing it.
+        maze = solution_steps = None
+        memory.close()
+
+def is_valid_path(maze: Maze, indices: Sequence[int], start: int, goal: int) -> bool:
+    """Whether indices walk open edges from goal back to start."""
+    if not indices or indices[0] != goal or indices[-1] != start:
+        return False
+    neighbors = maze.adjacency.neighbors
+    return all(b in neighbors(a) for a, b in zip(indices, indices[1:]))
@@ -1,9 +1,10 @@
 # renderer.py
+import math
 import textwrap
 import tempfile
 import webbrowser
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, Sequence
 
 from maze_solver.models.maze import Maze
 from maze_solver.models.role import Role
@@ -84,7 +85,7 @@ class SVGRenderer:
             )
         )
 
-    def render_step(self, maze: Maze, step: List[Square]) -> SVG:
+    def render_step(self, maze: Maze, step: Sequence[Square]) -> SVG:
         margins = 2 * (self.offset + self.line_width)
         width = margins + maze.width * self.square_size
         height = margins + maze.height * self.square_size
@@ -100,6 +101,31 @@ class SVGRenderer:
             )
         )
 
+    def render_animation(self, maze: Maze, path: Sequence[Square], duration: float, reveal: bool = True) -> SVG:
+        """The maze drawn once, with the path drawn in (or out) over `duration` seconds, looping.
+
+        Only the dash offset of a single polyline is animated, so the
+        output grows with the maze plus the path, not their product.
+        """
+        margins = 2 * (self.offset + self.line_width)
+        width = margins + maze.width * self.square_size
+        height = margins + maze.height * self.square_size
+        return SVG(
+            tag(
+                "svg",
+                content="".join([
+                    background(self.square_size * maze.width, self.square_size * maze.height),
+                    *map(self._draw_square, maze),
+                    self._draw_animated_path(path, duration, reveal),
+                ]),
+                xmlns="http://www.w3.org/2000/svg",
+                stroke_linejoin="round",
+                width="100vw",
+                height="100vh",
+                viewBox=f"0 0 {width} {height}",
+            )
+        )
+
     def _get_body(self, maze: Maze, solution: Optional[Solution]) -> str:
         return "".join([
             arrow_marker(),
@@ -108,7 +134,7 @@ class SVGRenderer:
             self._draw_solution(solution) if solution else "",
         ])
 
-    def _get_body_step(self, maze: Maze, step: List[Square]) -> str:
+    def _get_body_step(self, maze: Maze, step: Sequence[Square]) -> str:
         return "".join([
             arrow_marker(),
             background(self.square_size * maze.width, self.square_size * maze.height),
@@ -158,7 +184,7 @@ class SVGRenderer:
             marker_end="url(#arrow)"
         )
 
-    def _draw_solution_step(self, step: List[Square]) -> str:
+    def _draw_solution_step(self, step: Sequence[Square]) -> str:
         return Polyline(
             [
                 self._transform(point, self.square_size // 2)
@@ -172,6 +198,29 @@ class SVGRenderer:
             marker_end="url(#arrow)"
         )
 
+    def _draw_animated_path(self, path: Sequence[Square], duration: float, reveal: bool) -> str:
+        points = [self._transform(square, self.square_size // 2) for square in path]
+        length = sum(math.dist((a.x, a.y), (b.x, b.y)) for a, b in zip(points, points[1:]))
+        hidden, shown = (length, 0) if reveal else (0, length)
+        return tag(
+            "polyline",
+            content=tag(
+                "animate",
+                attributeName="stroke-dashoffset",
+                values=f"{hidden};{shown}",
+                dur=f"{duration}s",
+                repeatCount="indefinite",
+            ),
+            points=" ".join(f"{point.x},{point.y}" for point in points),
+            stroke="red",
+            stroke_width=self.line_width * 2,
+            stroke_opacity="0.5",
+            stroke_linecap="round",
+            fill="none",
+            stroke_dasharray=length,
+            stroke_dashoffset=hidden,
+        )
+
 ROLE_EMOJI = {
     Role.ENTRANCE: "\N{mouse face}",
     Role.EXIT: "\N{chequered flag}",
@@ -0,0 +1,69 @@
+# mazes.py
+import array
+import pathlib
+import random
+from typing import Optional
+
+from maze_solver.generators import GENERATORS
+from maze_solver.graphs.adjacency import DIRECTIONS, OPPOSITE, direction_deltas
+from maze_solver.models.maze import Maze
+from maze_solver.models.role import Role
+from maze_solver.models.solution import Steps
+from maze_solver.persistence.file_format import FileHeader
+
+def generate(width: int, height: int, seed: int, generator: str = "dfs") -> Maze:
+    random.seed(seed)
+    return GENERATORS[generator](width, height)
+
+def with_loops(maze: Maze, count: int, seed: int) -> Maze:
+    """The maze with `count` random inner borders knocked down, creating loops."""
+    rng = random.Random(seed)
+    values = array.array("B", maze.square_values)
+    deltas = direction_deltas(maze.width)
+    for _ in range(count):
+        index = rng.randrange(len(values))
+        row, column = divmod(index, maze.width)
+        direction = rng.choice(DIRECTIONS)
+        neighbor = index + deltas[direction]
+        if not (0 <= neighbor < len(values)) or abs(neighbor % maze.width - column) > 1:
+            continue
+        values[index] &= ~int(direction) & 0xff
+        values[neighbor] &= ~int(OPPOSITE[direction]) & 0xff
+    return Maze(maze.width, maze.height, values)
+
+def with_roles(maze: Maze, rewards: int, enemies: int, seed: int) -> Maze:
+    """The maze with rewards and enemies scattered over plain squares."""
+    rng = random.Random(seed)
+    values = array.array("B", maze.square_values)
+    plain = [index for index, value in enumerate(values) if value >> 4 == Role.NONE]
+    chosen = rng.sample(plain, rewards + enemies)
+    for position, index in enumerate(chosen):
+        role = Role.REWARD if position < rewards else Role.ENEMY
+        values[index] = (role << 4) | (values[index] & 0xf)
+    return Maze(maze.width, maze.height, values)
+
+def write_blank(path: pathlib.Path, width: int, height: int) -> pathlib.Path:
+    """A maze file with no borders at all, written without building a Maze."""
+    with path.open("wb") as file:
+        FileHeader(1, width, height).write(file)
+        row = bytes(width)
+        for _ in range(height):
+            file.write(row)
+    return path
+
+def path_indices(steps: Optional[Steps]) -> Optional[list]:
+    """Square indices of a solution, goal first, or None."""
+    if not steps:
+        return None
+    return [square.index for square in steps[0]]
+
+def path_cost(maze, indices: list) -> int:
+    """Cost of walking a goal-first path from start to goal."""
+    cost = maze.adjacency.cost
+    walk = indices[::-1]
+    return sum(cost(a, b) for a, b in zip(walk, walk[1:]))
+
+def is_walk(maze, indices: list) -> bool:
+    """Whether consecutive squares are joined by open edges."""
+    neighbors = maze.adjacency.neighbors
+    return all(b in neighbors(a) for a, b in zip(indices, indices[1:]))
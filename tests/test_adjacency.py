@@ -0,0 +1,37 @@
+# test_adjacency.py
+import pytest
+
+from maze_solver.graphs.adjacency import Adjacency, LazyAdjacency
+from maze_solver.models.border import Border
+
+from mazes import generate, with_loops
+
+def neighbors_by_borders(maze, index):
+    """Neighbors found the slow way, by checking both sides of every edge."""
+    square = maze.squares[index]
+    found = []
+    for direction, opposite, delta, inside in (
+        (Border.TOP, Border.BOTTOM, -maze.width, square.row > 0),
+        (Border.RIGHT, Border.LEFT, 1, square.column < maze.width - 1),
+        (Border.BOTTOM, Border.TOP, maze.width, square.row < maze.height - 1),
+        (Border.LEFT, Border.RIGHT, -1, square.column > 0),
+    ):
+        if inside and not square.border & direction and not maze.squares[index + delta].border & opposite:
+            found.append(index + delta)
+    return found
+
+@pytest.mark.parametrize("width, height", [(1, 1), (1, 7), (7, 1), (13, 9)])
+def test_adjacency_matches_borders(width, height):
+    maze = with_loops(generate(width, height, seed=3), count=width * height // 3, seed=3)
+    adjacency = Adjacency.build(maze.width, maze.height, maze.square_values)
+    for index in range(width * height):
+        assert adjacency.neighbors(index) == neighbors_by_borders(maze, index)
+
+def test_lazy_adjacency_matches_prebuilt():
+    maze = with_loops(generate(21, 17, seed=4), count=60, seed=4)
+    built = Adjacency.build(maze.width, maze.height, maze.square_values)
+    lazy = LazyAdjacency(maze.width, maze.height, maze.square_values)
+    for index in reversed(range(maze.width * maze.height)):
+        assert lazy.mask(index) == built.mask(index)
+        assert lazy.neighbors(index) == built.neighbors(index)
+    assert lazy.open_directions == built.open_directions
@@ -0,0 +1,28 @@
+# test_animation.py
+import re
+
+from maze_solver.graphs import solver
+from maze_solver.graphs.registry import get_solver
+from maze_solver.view.renderer import SVGRenderer
+
+from mazes import generate
+
+def test_animation_is_one_drawing_with_an_animated_path():
+    maze = generate(12, 12, seed=6)
+    path = get_solver("bfs")(maze, maze.entrance, maze.exit)[0]
+    svg = SVGRenderer().render_animation(maze, path, duration=3.0).xml_content
+    assert svg.count("<svg") == 1
+    assert svg.count("<animate") == 1
+    assert 'attributeName="stroke-dashoffset"' in svg and 'dur="3.0s"' in svg
+    # The animated path is the last polyline, with one point per square.
+    points = re.findall(r'<polyline[^>]*points="([^"]*)"', svg)[-1].split()
+    assert len(points) == len(path)
+
+def test_animate_solution_writes_a_single_page(monkeypatch):
+    opened = []
+    monkeypatch.setattr(solver.webbrowser, "open", opened.append)
+    maze = generate(20, 20, seed=6)
+    steps = get_solver("bfs")(maze, maze.entrance, maze.exit)
+    solver.animate_solution(maze, steps, 0.1, "top-down")
+    page = open(opened[0].removeprefix("file://"), encoding="utf-8").read()
+    assert page.count("<svg") == 1
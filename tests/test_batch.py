@@ -0,0 +1,32 @@
+# test_batch.py
+from maze_solver.batch import find_mazes, solve_batch
+from maze_solver.graphs.registry import get_solver
+
+from mazes import generate, path_indices, with_loops
+
+def test_batch_solves_and_renders_every_file(tmp_path):
+    for directory, seed in (("a", 1), ("b", 2)):
+        (tmp_path / directory).mkdir()
+        generate(8, 8, seed).dump(tmp_path / directory / "x.maze")
+    (tmp_path / "a" / "broken.maze").write_bytes(b"nope")
+    paths = find_mazes([str(tmp_path)])
+    assert len(paths) == 3
+
+    results = {result.path: result for result in solve_batch(paths, "bfs", workers=2, chunksize=1, render=tmp_path / "svg")}
+    assert set(results) == {str(path) for path in paths}
+    broken = results.pop(str(tmp_path / "a" / "broken.maze"))
+    assert not broken.solved and broken.error
+    assert all(result.solved and result.nodes_expanded > 0 for result in results.values())
+    assert len(list((tmp_path / "svg").glob("*-x.svg"))) == 2
+
+def test_batch_path_lengths_match_bfs(tmp_path):
+    mazes = {}
+    for seed in range(4):
+        maze = with_loops(generate(15, 12, seed), count=40, seed=seed)
+        mazes[str(tmp_path / f"{seed}.maze")] = maze
+        maze.dump(tmp_path / f"{seed}.maze")
+    bfs = get_solver("bfs")
+    for result in solve_batch(find_mazes([str(tmp_path)]), "a-star", workers=2, chunksize=1):
+        maze = mazes[result.path]
+        assert result.solved
+        assert result.path_length == len(path_indices(bfs(maze, maze.entrance, maze.exit)))
@@ -0,0 +1,63 @@
+# test_bench.py
+import csv
+import json
+from collections import Counter
+
+from maze_solver.bench import run_benchmarks, write_results
+from maze_solver.graphs.distance import DistanceField
+from maze_solver.graphs.hierarchy import ClusterGraph
+from maze_solver.graphs.registry import SOLVERS, get_solver, solver_names
+from maze_solver.graphs.solver import SearchStats
+
+from mazes import generate, with_loops
+
+def test_benchmark_reports_expansions():
+    solvers = [get_solver("bfs"), get_solver("jump-point"), get_solver("distance-field")]
+    results = {result.algorithm: result for result in run_benchmarks(["dfs"], [(20, 20)], solvers, repeats=2)}
+    assert all(result.solved for result in results.values())
+    assert results["bfs"].path_length == results["distance-field"].path_length
+    assert 0 < results["jump-point"].nodes_expanded <= results["bfs"].nodes_expanded
+    assert results["distance-field"].nodes_expanded is None
+
+def test_fringe_avoids_heap_pushes():
+    results = {
+        result.algorithm: result
+        for result in run_benchmarks(["kruskal"], [(25, 25)], [get_solver("a-star"), get_solver("fringe")], repeats=1)
+    }
+    assert results["a-star"].heap_pushes > 0 and results["a-star"].list_pushes == 0
+    assert results["fringe"].heap_pushes == 0 and results["fringe"].list_pushes > 0
+    assert results["a-star"].path_length == results["fringe"].path_length
+
+def test_every_counting_solver_counts():
+    maze = with_loops(generate(15, 15, seed=2), 30, seed=2)
+    solver_names()
+    for info in SOLVERS.values():
+        if info.reports_stats:
+            stats = SearchStats()
+            assert info(maze, maze.entrance, maze.exit, stats), info.name
+            assert stats.expanded > 0, info.name
+
+def test_write_results(tmp_path):
+    results = list(run_benchmarks(["prims"], [(8, 8)], [get_solver("bfs"), get_solver("hpa")], repeats=1))
+    write_results(results, tmp_path / "results.json")
+    rows = json.loads((tmp_path / "results.json").read_text())
+    assert [row["algorithm"] for row in rows] == ["bfs", "hpa"]
+    write_results(results, tmp_path / "results.csv")
+    with (tmp_path / "results.csv").open() as file:
+        assert [row["nodes_expanded"] for row in csv.DictReader(file)][1] == ""
+
+def counting_builds(monkeypatch, cls, builds):
+    build = cls.build
+    def counted(_, *args, **kwargs):
+        builds[cls.__name__] += 1
+        return build(*args, **kwargs)
+    monkeypatch.setattr(cls, "build", classmethod(counted))
+
+def test_timed_runs_rebuild_solver_caches(monkeypatch):
+    builds = Counter()
+    counting_builds(monkeypatch, DistanceField, builds)
+    counting_builds(monkeypatch, ClusterGraph, builds)
+    solvers = [get_solver("distance-field"), get_solver("hpa")]
+    list(run_benchmarks(["dfs"], [(20, 20)], solvers, repeats=3, warmup=1))
+    # One build for the warmup, one per timed repeat and one for the counted run.
+    assert builds == {"DistanceField": 5, "ClusterGraph": 5}
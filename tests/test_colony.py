@@ -0,0 +1,63 @@
+# test_colony.py
+import array
+import time
+
+import pytest
+
+from maze_solver.graphs.genetic import STEP_CAP, out_of_reach
+from maze_solver.graphs.registry import get_solver
+from maze_solver.models.border import Border
+from maze_solver.models.maze import Maze
+from maze_solver.models.role import Role
+
+from mazes import generate, is_walk, path_indices
+
+np = pytest.importorskip("numpy")
+
+from maze_solver.graphs.colony import ColonyTables, ant_colony  # noqa: E402
+from maze_solver.graphs.genetic import evolve  # noqa: E402
+
+def corridor(length: int) -> Maze:
+    """A single row open from end to end."""
+    closed = Border.TOP | Border.BOTTOM
+    values = array.array("B", [closed] * length)
+    values[0] |= (Role.ENTRANCE << 4) | Border.LEFT
+    values[-1] |= (Role.EXIT << 4) | Border.RIGHT
+    return Maze(length, 1, values)
+
+def test_ant_colony_finds_the_path_of_a_small_maze():
+    maze = generate(10, 10, seed=8)
+    indices = ant_colony(maze, maze.entrance.index, maze.exit.index, seed=2)
+    assert indices is not None and is_walk(maze, list(indices))
+    assert list(indices) == path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+
+def test_ant_colony_solves_a_realistic_maze():
+    maze = generate(60, 60, seed=4)
+    indices = ant_colony(maze, maze.entrance.index, maze.exit.index, ants=40, iterations=3, seed=0)
+    assert indices is not None
+    assert list(indices) == path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+
+def test_ants_lay_pheromones_along_their_paths_only():
+    maze = generate(12, 12, seed=6)
+    tables = ColonyTables.build(maze, maze.entrance.index, maze.exit.index)
+    pheromones = np.ones(len(tables.masks) * 4)
+    edges, lengths = tables.march(pheromones, 30, 4 * 144, np.random.default_rng(1))
+    # Ants that don't revisit squares reach the goal within two moves per square.
+    assert (lengths > 0).all()
+    for row, length in zip(edges, lengths):
+        squares = (row[:length] // 4).tolist() + [maze.exit.index]
+        assert squares[0] == maze.entrance.index
+        assert len(set(squares)) == len(squares) and is_walk(maze, squares)
+
+def test_ant_colony_shares_pheromones_across_workers():
+    maze = generate(8, 8, seed=9)
+    indices = ant_colony(maze, maze.entrance.index, maze.exit.index, workers=2, seed=3)
+    assert list(indices) == path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+
+@pytest.mark.parametrize("engine", [ant_colony, evolve])
+def test_goals_beyond_the_step_cap_are_skipped(engine):
+    maze = corridor(STEP_CAP + 2)
+    assert out_of_reach(maze.width, 0, maze.width - 1, STEP_CAP)
+    started = time.perf_counter()
+    assert engine(maze, 0, maze.width - 1) is None
+    assert time.perf_counter() - started < 1
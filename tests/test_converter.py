@@ -0,0 +1,32 @@
+# test_converter.py
+import random
+
+import pytest
+
+from maze_solver.graphs.converter import solve_contracted
+from maze_solver.graphs.registry import get_solver
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+@pytest.mark.parametrize("name", ["dijkstra", "a-star", "fringe", "bidirectional-a-star", "bellman-ford"])
+def test_contracted_lengths_match_bfs(name):
+    bfs, solver = get_solver("bfs"), get_solver(name)
+    maze = with_loops(generate(30, 20, seed=11), count=80, seed=11)
+    assert len(maze.junction_graph) < len(maze.squares)
+    rng = random.Random(11)
+    squares = maze.squares
+    # Random squares are mostly inside corridors, so they get spliced in.
+    pairs = [(maze.entrance, maze.exit)] + [
+        (squares[rng.randrange(len(squares))], squares[rng.randrange(len(squares))]) for _ in range(30)
+    ]
+    for start, goal in pairs:
+        expected = path_indices(bfs(maze, start, goal))
+        found = path_indices(solve_contracted(maze, start, goal, solver))
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(maze, found)
+
+def test_grid_only_solvers_are_rejected():
+    maze = generate(5, 5, seed=0)
+    with pytest.raises(ValueError):
+        solve_contracted(maze, maze.entrance, maze.exit, get_solver("jump-point"))
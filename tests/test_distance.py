@@ -0,0 +1,51 @@
+# test_distance.py
+import array
+from collections import OrderedDict
+
+import pytest
+
+from maze_solver.graphs import distance
+from maze_solver.graphs.distance import UNREACHABLE, DistanceField, distance_field
+from maze_solver.graphs.registry import get_solver
+from maze_solver.models.maze import Maze
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(distance, "_cache", OrderedDict())
+
+def test_distance_field_matches_bfs():
+    bfs = get_solver("bfs")
+    maze = with_loops(generate(18, 12, seed=13), count=50, seed=13)
+    goal = maze.squares[100]
+    field = DistanceField.build(maze, goal.index)
+    for start in maze.squares:
+        expected = path_indices(bfs(maze, start, goal))
+        assert field.distances[start.index] == len(expected) - 1
+        found = path_indices(field.path_from(maze, start.index))
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(maze, found)
+
+def test_unreachable_squares_have_no_path():
+    boxed = Maze(1, 2, array.array("B", [0xf, 0xf]))
+    field = DistanceField.build(boxed, 1)
+    assert field.distances[0] == UNREACHABLE
+    assert field.path_from(boxed, 0) is None
+
+def test_cache_dir_round_trip(tmp_path):
+    maze = generate(15, 10, seed=14)
+    built = distance_field(maze, maze.exit.index, tmp_path)
+    assert distance_field(maze, maze.exit.index, tmp_path) is built
+    assert [path.name for path in tmp_path.iterdir()] == [f"{maze.digest}-{maze.exit.index}.dist"]
+
+    distance._cache.clear()
+    loaded = distance_field(maze, maze.exit.index, tmp_path)
+    assert loaded is not built and loaded == built
+
+def test_edited_mazes_get_their_own_field(tmp_path):
+    maze = generate(15, 10, seed=15)
+    edited = with_loops(maze, count=30, seed=15)
+    assert distance_field(maze, 0, tmp_path) != distance_field(edited, 0, tmp_path)
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,50 @@
+# test_genetic.py
+import sys
+
+import pytest
+
+from maze_solver.graphs.registry import eligible_solvers, get_solver
+
+from mazes import generate, is_walk, path_indices
+
+def test_missing_numpy_is_reported(monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    names = [info.name for info in eligible_solvers()]
+    assert "genetic" not in names and "ant-colony" not in names
+    maze = generate(5, 5, seed=0)
+    with pytest.raises(ModuleNotFoundError, match=r"maze-solver\[fast\]"):
+        get_solver("genetic")(maze, maze.entrance, maze.exit)
+
+def test_evolve_finds_the_path_of_a_small_maze():
+    pytest.importorskip("numpy")
+    from maze_solver.graphs.genetic import evolve
+    maze = generate(8, 8, seed=7)
+    indices = evolve(maze, maze.entrance.index, maze.exit.index, seed=1)
+    assert indices is not None
+    assert indices[0] == maze.exit.index and indices[-1] == maze.entrance.index
+    assert is_walk(maze, list(indices))
+    # A perfect maze has one simple path, which walks that never revisit
+    # a square always end up on.
+    assert list(indices) == path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+
+def test_evolve_solves_a_realistic_maze():
+    pytest.importorskip("numpy")
+    from maze_solver.graphs.genetic import evolve
+    maze = generate(60, 60, seed=3)
+    indices = evolve(maze, maze.entrance.index, maze.exit.index, population_size=40, generations=5, seed=0)
+    assert indices is not None
+    assert list(indices) == path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+
+def test_walks_retreat_only_at_dead_ends():
+    np = pytest.importorskip("numpy")
+    from maze_solver.graphs.genetic import WalkTables
+    maze = generate(12, 12, seed=5)
+    tables = WalkTables.build(maze, maze.entrance.index, maze.exit.index)
+    genomes = np.random.default_rng(0).integers(0, 256, (30, 4 * 144), dtype=np.uint8)
+    walks, moves = tables.walk(genomes)
+    # Depth-first walks reach the goal within two moves per square.
+    assert (moves >= 0).all() and (moves <= 2 * 144).all()
+    for row in range(len(genomes)):
+        squares = walks.squares(row).tolist()
+        assert squares[-1] == maze.exit.index
+        assert len(set(squares)) == len(squares) and is_walk(maze, squares)
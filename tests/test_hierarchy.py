@@ -0,0 +1,33 @@
+# test_hierarchy.py
+import random
+
+import pytest
+
+from maze_solver.graphs.hierarchy import ClusterGraph
+from maze_solver.graphs.registry import get_solver
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+@pytest.mark.parametrize("cluster_size", [1, 3, 4, 7, 64])
+def test_cluster_paths_match_bfs(cluster_size):
+    bfs = get_solver("bfs")
+    # Widths that aren't multiples of the cluster size leave ragged clusters.
+    maze = with_loops(generate(30, 22, seed=20), count=120, seed=20)
+    graph = ClusterGraph.build(maze, cluster_size)
+    rng = random.Random(cluster_size)
+    squares = maze.squares
+    for _ in range(40):
+        start, goal = squares[rng.randrange(len(squares))], squares[rng.randrange(len(squares))]
+        expected = path_indices(bfs(maze, start, goal))
+        found = list(graph.search(maze, start.index, goal.index))
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(maze, found)
+
+def test_hpa_solver_matches_bfs():
+    maze = with_loops(generate(70, 45, seed=21), count=300, seed=21)
+    expected = path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+    found = path_indices(get_solver("hpa")(maze, maze.entrance, maze.exit))
+    assert len(found) == len(expected)
+    assert is_walk(maze, found)
+    assert maze.cluster_graph is maze.cluster_graph
@@ -0,0 +1,92 @@
+# test_incremental.py
+import array
+import dataclasses
+import random
+
+from maze_solver.graphs.adjacency import DIRECTIONS, OPPOSITE, direction_deltas
+from maze_solver.graphs.incremental import IncrementalSolver
+from maze_solver.graphs.pruning import DeadEnds
+from maze_solver.graphs.registry import get_solver
+from maze_solver.graphs.solver import SearchStats
+from maze_solver.models.maze import Maze
+from maze_solver.models.role import Role
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+def walled_in(maze):
+    """The maze with every Role.WALL square closed off by borders, for solvers that ignore roles."""
+    return DeadEnds(bytes(square.role == Role.WALL for square in maze)).apply(maze)
+
+def with_squares(maze, squares):
+    values = array.array("B", maze.square_values)
+    for square in squares:
+        values[square.index] = (square.role << 4) | square.border
+    return Maze(maze.width, maze.height, values)
+
+def random_edits(maze, keep, rng):
+    """A few random edits: knocked down borders, toggled walls and new borders."""
+    deltas = direction_deltas(maze.width)
+    squares = maze.squares
+    edits = {}
+    for _ in range(rng.randrange(1, 6)):
+        square = squares[rng.randrange(len(squares))]
+        square = edits.get(square.index, square)
+        # Open more edges than get closed, so the goal stays reachable often enough.
+        kind = rng.choice(("open", "open", "wall", "close"))
+        if kind == "wall" and square.index not in keep:
+            role = Role.NONE if square.role == Role.WALL else Role.WALL
+            edits[square.index] = dataclasses.replace(square, role=role)
+            continue
+        direction = rng.choice(DIRECTIONS)
+        neighbor = square.index + deltas[direction]
+        if not 0 <= neighbor < len(squares) or abs(neighbor % maze.width - square.column) > 1:
+            continue
+        other = edits.get(neighbor, squares[neighbor])
+        if kind == "open":
+            edits[square.index] = dataclasses.replace(square, border=square.border & ~direction)
+            edits[neighbor] = dataclasses.replace(other, border=other.border & ~OPPOSITE[direction])
+        else:
+            edits[square.index] = dataclasses.replace(square, border=square.border | direction)
+    return list(edits.values())
+
+def test_replanning_matches_fresh_solves():
+    bfs = get_solver("bfs")
+    maze = with_loops(generate(20, 15, seed=21), count=150, seed=21)
+    start, goal = maze.entrance, maze.exit
+    solver = IncrementalSolver(maze, start, goal)
+    rng = random.Random(21)
+    for _ in range(60):
+        solver.update(random_edits(solver.maze, {start.index, goal.index}, rng))
+        found = path_indices(solver.solve())
+        current = walled_in(solver.maze)
+        expected = path_indices(bfs(current, start, goal))
+        if expected is None:
+            assert found is None
+            continue
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(current, found)
+        assert len(path_indices(IncrementalSolver(solver.maze, start, goal).solve())) == len(expected)
+
+def test_replanning_expands_fewer_squares_than_starting_over():
+    maze = with_loops(generate(40, 40, seed=22), count=200, seed=22)
+    start, goal = maze.entrance, maze.exit
+    stats = SearchStats()
+    solver = IncrementalSolver(maze, start, goal, stats)
+    path = path_indices(solver.solve())
+    # Wall off the square nearest the goal that the path can detour around.
+    bfs = get_solver("bfs")
+    for index in path[1:-1]:
+        blocked = maze.squares[index]
+        edited = walled_in(with_squares(maze, [dataclasses.replace(blocked, role=Role.WALL)]))
+        if bfs(edited, start, goal):
+            break
+    solver.update([dataclasses.replace(blocked, role=Role.WALL)])
+    stats.expanded = 0
+    replanned = path_indices(solver.solve())
+
+    fresh_stats = SearchStats()
+    fresh = path_indices(IncrementalSolver(solver.maze, start, goal, fresh_stats).solve())
+    assert blocked.index not in replanned
+    assert len(replanned) == len(fresh)
+    assert stats.expanded < fresh_stats.expanded
@@ -0,0 +1,53 @@
+# test_main.py
+import pytest
+
+from maze_solver.__main__ import parse_args, solve_maze_python_wrapper
+from maze_solver.graphs.registry import SOLVERS, solver_names
+
+from mazes import generate, with_roles
+
+@pytest.fixture
+def maze_path(tmp_path):
+    path = tmp_path / "roles.maze"
+    with_roles(generate(12, 12, seed=3), rewards=10, enemies=10, seed=3).dump(path)
+    return path
+
+def solve(maze_path, tmp_path, algorithm, **options):
+    solve_maze_python_wrapper(maze_path, tmp_path / "output", algorithm, False, 0.0, "top-down", test=True, **options)
+
+solver_names()  # Fill the registry for the parametrization below.
+
+@pytest.mark.parametrize("algorithm", [name for name, info in SOLVERS.items() if not info.weighted])
+def test_weighted_falls_back_for_unweighted_solvers(maze_path, tmp_path, capsys, algorithm):
+    solve(maze_path, tmp_path, algorithm, weights=(1, 2))
+    output = capsys.readouterr().out
+    assert f"Warning: {algorithm} ignores step costs" in output
+    assert f"solved: {algorithm}" in output
+
+@pytest.mark.parametrize("flags", [["--race", "--contract"], ["--race", "--weighted"], ["--contract", "--weighted"]])
+def test_incompatible_flags_are_rejected(monkeypatch, maze_path, flags):
+    monkeypatch.setattr("sys.argv", ["solve", str(maze_path), *flags])
+    with pytest.raises(SystemExit):
+        parse_args()
+
+@pytest.mark.parametrize("algorithm", ["a-star", "fringe", "dijkstra", "dial", "bidirectional-a-star"])
+def test_negative_costs_are_refused(maze_path, tmp_path, algorithm):
+    with pytest.raises(SystemExit) as exit_info:
+        solve(maze_path, tmp_path, algorithm, weights=(2, 2))
+    assert "need bellman-ford" in str(exit_info.value.code)
+
+def test_auto_accepts_negative_costs(tmp_path, capsys):
+    path = tmp_path / "reward.maze"
+    with_roles(generate(12, 12, seed=3), rewards=1, enemies=5, seed=3).dump(path)
+    solve(path, tmp_path, "auto", weights=(2, 2))
+    assert "solved: auto" in capsys.readouterr().out
+
+def test_negative_cycles_exit_cleanly(maze_path, tmp_path):
+    with pytest.raises(SystemExit) as exit_info:
+        solve(maze_path, tmp_path, "bellman-ford", weights=(3, 2))
+    assert "Negative cycle" in str(exit_info.value.code)
+
+@pytest.mark.parametrize("algorithm", ["bfs", "wall-follower"])
+def test_prune_solves_the_original_maze(maze_path, tmp_path, capsys, algorithm):
+    solve(maze_path, tmp_path, algorithm, prune=True)
+    assert f"solved: {algorithm}" in capsys.readouterr().out
@@ -0,0 +1,64 @@
+# test_maze.py
+import pathlib
+
+import pytest
+
+from maze_solver.graphs.registry import get_solver
+from maze_solver.models.border import Border
+from maze_solver.models.maze import Maze
+from maze_solver.models.role import Role
+from maze_solver.models.square import Square
+
+from mazes import generate, path_indices, write_blank
+
+def resident_bytes() -> int:
+    return int(pathlib.Path("/proc/self/statm").read_text().split()[1]) * 4096
+
+def test_maze_packs_squares_into_bytes():
+    squares = [
+        Square(0, 0, 0, Border.TOP | Border.LEFT, Role.ENTRANCE),
+        Square(1, 0, 1, Border.TOP | Border.RIGHT, Role.ENEMY),
+        Square(2, 1, 0, Border.BOTTOM | Border.LEFT, Role.REWARD),
+        Square(3, 1, 1, Border.BOTTOM | Border.RIGHT, Role.EXIT),
+    ]
+    maze = Maze.from_squares(squares)
+    assert (maze.width, maze.height) == (2, 2)
+    assert bytes(maze.square_values) == bytes([0x29, 0x53, 0x6c, 0x36])
+    assert list(maze) == squares
+    assert maze.squares[-1] == squares[-1]
+    assert maze.squares[1:3] == squares[1:3]
+    assert (maze.entrance, maze.exit) == (squares[0], squares[-1])
+
+def test_dump_and_load_round_trip(tmp_path):
+    maze = generate(17, 9, seed=0)
+    maze.dump(tmp_path / "maze.maze")
+    loaded = Maze.load(tmp_path / "maze.maze")
+    assert loaded == maze
+    assert loaded.digest == maze.digest
+
+def test_open_solves_like_load(tmp_path):
+    path = tmp_path / "small.maze"
+    generate(30, 20, seed=1).dump(path)
+    loaded = Maze.load(path)
+    opened = Maze.open(path)
+    assert opened.mapped
+    assert bytes(opened.square_values) == bytes(loaded.square_values)
+    bfs = get_solver("bfs")
+    assert path_indices(bfs(opened, opened.entrance, opened.exit)) == path_indices(
+        bfs(loaded, loaded.entrance, loaded.exit)
+    )
+
+def test_open_does_not_build_mask_table(tmp_path):
+    maze = Maze.open(write_blank(tmp_path / "blank.maze", 2000, 2000))
+    start = maze.squares[0]
+    assert path_indices(get_solver("bfs")(maze, start, start)) == [0]
+    assert "open_directions" not in vars(maze.adjacency)
+
+@pytest.mark.skipif(not pathlib.Path("/proc/self/statm").exists(), reason="needs /proc")
+def test_open_touches_only_visited_pages(tmp_path):
+    maze = Maze.open(write_blank(tmp_path / "blank.maze", 4000, 4000))
+    start = maze.squares[0]
+    before = resident_bytes()
+    get_solver("bfs")(maze, start, maze.squares[1])
+    # A dense mask table alone would be 16 MB.
+    assert resident_bytes() - before < 4 * 2 ** 20
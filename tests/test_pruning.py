@@ -0,0 +1,40 @@
+# test_pruning.py
+import itertools
+
+import pytest
+
+from maze_solver.graphs.pruning import DeadEnds, prune_dead_ends
+from maze_solver.graphs.registry import get_solver
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+@pytest.mark.parametrize("generator", ["dfs", "kruskal"])
+def test_perfect_mazes_prune_down_to_the_solution(generator):
+    maze = generate(25, 18, seed=24, generator=generator)
+    solution = path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+    dead_ends = DeadEnds.find(maze, (maze.entrance.index, maze.exit.index))
+    kept = set(itertools.compress(range(len(maze.squares)), (not filled for filled in dead_ends.filled)))
+    assert kept == set(solution)
+    assert len(dead_ends) == len(maze.squares) - len(solution)
+
+@pytest.mark.parametrize("name", ["bfs", "a-star", "dead-end", "wall-follower", "tremaux", "recursive-bt"])
+def test_solvers_find_the_same_length_after_pruning(name):
+    maze = generate(25, 18, seed=25)
+    expected = path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+    pruned = prune_dead_ends(maze)
+    found = path_indices(get_solver(name)(pruned, pruned.entrance, pruned.exit))
+    assert len(found) == len(expected)
+    assert is_walk(maze, found)
+
+def test_looped_mazes_keep_every_shortest_path():
+    bfs = get_solver("bfs")
+    maze = with_loops(generate(25, 18, seed=26), count=60, seed=26)
+    keep = (maze.entrance.index, maze.exit.index, 200)
+    dead_ends = DeadEnds.find(maze, keep)
+    pruned = dead_ends.apply(maze)
+    assert len(dead_ends) > 0
+    for index in itertools.compress(range(len(maze.squares)), dead_ends.filled):
+        assert not pruned.adjacency.neighbors(index)
+    for start, goal in itertools.permutations([maze.squares[index] for index in keep], 2):
+        found = path_indices(bfs(pruned, start, goal))
+        assert len(found) == len(path_indices(bfs(maze, start, goal)))
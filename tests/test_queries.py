@@ -0,0 +1,40 @@
+# test_queries.py
+import array
+import random
+
+import pytest
+
+from maze_solver.graphs.queries import solve_many
+from maze_solver.graphs.registry import get_solver
+from maze_solver.models.border import Border
+from maze_solver.models.maze import Maze
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+def split(maze: Maze, row: int) -> Maze:
+    """The maze with a wall across it below `row`, so some squares can't reach others."""
+    values = array.array("B", maze.square_values)
+    for column in range(maze.width):
+        values[row * maze.width + column] |= Border.BOTTOM
+        values[(row + 1) * maze.width + column] |= Border.TOP
+    return Maze(maze.width, maze.height, values)
+
+@pytest.mark.parametrize("algorithm", ["bfs", "a-star", "dijkstra", "jump-point"])
+def test_solve_many_matches_single_solves(algorithm):
+    bfs = get_solver("bfs")
+    maze = split(with_loops(generate(20, 16, seed=12), count=80, seed=12), row=7)
+    rng = random.Random(12)
+    squares = maze.squares
+    queries = [(squares[rng.randrange(len(squares))], squares[rng.randrange(len(squares))]) for _ in range(60)]
+    results = list(solve_many(maze, queries, algorithm))
+    assert len(results) == len(queries)
+    assert any(steps is None for steps in results) and not all(steps is None for steps in results)
+    for (start, goal), steps in zip(queries, results):
+        expected = path_indices(bfs(maze, start, goal))
+        if expected is None:
+            assert steps is None
+            continue
+        found = path_indices(steps)
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(maze, found)
@@ -0,0 +1,38 @@
+# test_race.py
+import os
+import time
+
+import pytest
+
+from maze_solver.graphs.registry import SOLVERS, Complexity, MemoryClass, get_solver, register
+from maze_solver.race import is_valid_path, race
+
+from mazes import generate, path_indices, with_loops
+
+@pytest.fixture(scope="module")
+def crashing_solver():
+    @register("test-crash", optimal=True, complexity=Complexity.LINEAR, memory=MemoryClass.PATH)
+    def crash(maze, start, goal):
+        os._exit(1)  # Like being OOM-killed: no exception, no result.
+    yield get_solver("test-crash")
+    del SOLVERS["test-crash"]
+
+def test_race_returns_a_valid_shortest_path():
+    maze = with_loops(generate(20, 20, seed=5), 40, seed=5)
+    entrants = [get_solver(name) for name in ("bfs", "a-star", "dfs")]
+    solver, steps = race(maze, maze.entrance, maze.exit, entrants, optimal=True)
+    assert solver.name in ("bfs", "a-star")
+    indices = path_indices(steps)
+    assert is_valid_path(maze, indices, maze.entrance.index, maze.exit.index)
+    assert len(indices) == len(path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit)))
+
+def test_race_ends_when_every_worker_dies(crashing_solver):
+    maze = generate(10, 10, seed=5)
+    started = time.monotonic()
+    assert race(maze, maze.entrance, maze.exit, [crashing_solver]) == (None, None)
+    assert time.monotonic() - started < 10
+
+def test_race_survives_a_dead_worker(crashing_solver):
+    maze = generate(10, 10, seed=5)
+    solver, steps = race(maze, maze.entrance, maze.exit, [crashing_solver, get_solver("bfs")])
+    assert solver.name == "bfs" and steps
@@ -0,0 +1,45 @@
+# test_registry.py
+import pytest
+
+from maze_solver.graphs.registry import Complexity, eligible_solvers, get_solver, select_solver, solver_names
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+def test_get_solver_rejects_unknown_names():
+    with pytest.raises(ValueError):
+        get_solver("no-such-solver")
+
+def test_eligible_solvers_meet_requirements():
+    solvers = eligible_solvers(optimal=True, weighted=True, max_complexity=Complexity.LINEARITHMIC)
+    assert solvers and all(info.optimal and info.weighted for info in solvers)
+    assert [info.complexity for info in solvers] == sorted(info.complexity for info in solvers)
+
+def test_exponential_solvers_are_opt_in():
+    assert get_solver("iddfs").complexity == Complexity.EXPONENTIAL
+    assert "iddfs" not in [info.name for info in eligible_solvers(max_complexity=Complexity.QUADRATIC)]
+    assert "iddfs" in [info.name for info in eligible_solvers()]
+
+def test_select_solver_picks_a_cheap_optimal_solver():
+    info = select_solver(generate(5, 5, seed=0))
+    assert info.optimal and info.complexity == Complexity.LINEAR
+    assert select_solver(generate(5, 5, seed=0), weighted=True, negative_costs=True).name == "bellman-ford"
+    assert set(solver_names()) >= {"bfs", "a-star", "iddfs", "dial", "hpa"}
+
+@pytest.mark.parametrize("info", eligible_solvers(optimal=True), ids=lambda info: info.name)
+def test_optimal_solvers_match_bfs(info):
+    bfs = get_solver("bfs")
+    for seed in range(3):
+        maze = with_loops(generate(8, 6, seed=seed), count=10, seed=seed)
+        expected = path_indices(bfs(maze, maze.entrance, maze.exit))
+        found = path_indices(info(maze, maze.entrance, maze.exit))
+        assert len(found) == len(expected)
+        assert found[0] == maze.exit.index and found[-1] == maze.entrance.index
+        assert is_walk(maze, found)
+
+@pytest.mark.parametrize("info", eligible_solvers(max_complexity=Complexity.LINEARITHMIC), ids=lambda info: info.name)
+def test_solvers_walk_between_entrance_and_exit(info):
+    maze = generate(12, 9, seed=5)
+    found = path_indices(info(maze, maze.entrance, maze.exit))
+    # The wall follower and Tremaux report their walk from the start.
+    assert {found[0], found[-1]} == {maze.entrance.index, maze.exit.index}
+    assert is_walk(maze, found)
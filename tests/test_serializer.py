@@ -0,0 +1,30 @@
+# test_serializer.py
+from maze_solver.models.maze import Maze
+from maze_solver.persistence.serializer import (
+    compress,
+    decode_planes,
+    decompress,
+    deserialize,
+    encode_planes,
+    serialize,
+)
+
+from mazes import generate, with_roles
+
+def test_planes_round_trip_every_value():
+    square_values = bytes(range(256))
+    borders, roles = decode_planes(square_values)
+    assert borders == bytes(value & 0xf for value in range(256))
+    assert roles == bytes(value >> 4 for value in range(256))
+    assert bytes(encode_planes(borders, roles)) == square_values
+
+def test_serialize_matches_per_square_compression():
+    maze = with_roles(generate(9, 7, seed=2), rewards=5, enemies=5, seed=2)
+    squares = list(maze)
+    header, body = serialize(maze.width, maze.height, squares)
+    assert bytes(body.square_values) == bytes(compress(square) for square in squares)
+    assert bytes(serialize(maze.width, maze.height, maze.squares)[1].square_values) == bytes(body.square_values)
+    assert list(deserialize(header, body)) == squares
+    for square in squares:
+        assert decompress(compress(square)) == (square.border, square.role)
+    assert Maze.from_squares(tuple(deserialize(header, body))) == maze
@@ -0,0 +1,44 @@
+# test_solution.py
+import array
+
+import pytest
+
+from maze_solver.graphs import solver
+from maze_solver.graphs.registry import get_solver
+from maze_solver.models.solution import PathSteps
+
+from mazes import generate
+
+def test_path_steps_are_shrinking_prefixes():
+    maze = generate(6, 6, seed=0)
+    steps = PathSteps(maze.squares, array.array("L", [35, 34, 28, 27]))
+    assert len(steps) == 4
+    assert [square.index for square in steps[0]] == [35, 34, 28, 27]
+    assert [square.index for square in steps[1]] == [35, 34, 28]
+    assert [square.index for square in steps[-1]] == [35]
+    assert steps[0][-1].index == 27
+    with pytest.raises(IndexError):
+        steps[4]
+
+def test_solver_paths_run_from_goal_to_start():
+    maze = generate(10, 10, seed=1)
+    steps = get_solver("bfs")(maze, maze.entrance, maze.exit)
+    assert isinstance(steps, PathSteps)
+    assert steps[0][0] == maze.exit and steps[0][-1] == maze.entrance
+    assert list(steps[-1]) == [maze.exit]
+
+@pytest.mark.parametrize("direction, expected", [("top-down", -1), ("bottom-up", 0)])
+def test_solve_maze_python_renders_the_final_step(monkeypatch, tmp_path, direction, expected):
+    rendered = []
+    render_step = solver.SVGRenderer.render_step
+    def recording(self, maze, step):
+        rendered.append(list(step))
+        return render_step(self, maze, step)
+    monkeypatch.setattr(solver.SVGRenderer, "render_step", recording)
+    monkeypatch.setattr(solver.webbrowser, "open", lambda url: None)
+    maze = generate(10, 10, seed=1)
+    maze.dump(tmp_path / "maze.maze")
+    solver.solve_maze_python(tmp_path / "maze.maze", tmp_path, "bfs", False, 0.0, direction)
+    steps = get_solver("bfs")(maze, maze.entrance, maze.exit)
+    assert rendered == [list(steps[expected])]
+    assert (tmp_path / "solution.svg").exists()
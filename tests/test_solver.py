@@ -0,0 +1,121 @@
+# test_solver.py
+import array
+import random
+import sys
+
+import pytest
+
+from maze_solver.graphs.registry import get_solver
+from maze_solver.graphs.solver import SearchStats
+from maze_solver.models.maze import Maze
+
+from mazes import generate, is_walk, path_indices, with_loops
+
+def random_pairs(maze, count, seed):
+    rng = random.Random(seed)
+    squares = maze.squares
+    return [(squares[rng.randrange(len(squares))], squares[rng.randrange(len(squares))]) for _ in range(count)]
+
+@pytest.mark.parametrize("name", ["bidirectional-bfs", "bidirectional-a-star"])
+def test_bidirectional_lengths_match_bfs(name):
+    bfs, solver = get_solver("bfs"), get_solver(name)
+    maze = with_loops(generate(30, 20, seed=8), count=150, seed=8)
+    for start, goal in random_pairs(maze, 40, seed=8):
+        expected = path_indices(bfs(maze, start, goal))
+        found = path_indices(solver(maze, start, goal))
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(maze, found)
+
+@pytest.mark.parametrize("name", ["bidirectional-bfs", "bidirectional-a-star"])
+def test_bidirectional_edge_cases(name):
+    solver = get_solver(name)
+    maze = generate(5, 5, seed=0)
+    assert path_indices(solver(maze, maze.entrance, maze.entrance)) == [maze.entrance.index]
+    boxed = Maze(3, 3, array.array("B", [0xf] * 9))
+    assert solver(boxed, boxed.squares[0], boxed.squares[8]) is None
+
+@pytest.mark.parametrize("loops", [60, 400])
+def test_jump_point_lengths_match_bfs(loops):
+    bfs, jump_point = get_solver("bfs"), get_solver("jump-point")
+    maze = with_loops(generate(25, 20, seed=9), count=loops, seed=9)
+    for start, goal in random_pairs(maze, 40, seed=9):
+        expected = path_indices(bfs(maze, start, goal))
+        found = path_indices(jump_point(maze, start, goal))
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(maze, found)
+
+def test_jump_point_expands_fewer_squares_in_open_rooms():
+    maze = Maze(40, 40, array.array("B", bytes(1600)))
+    start, goal = maze.squares[0], maze.squares[-1]
+    a_star_stats, jump_point_stats = SearchStats(), SearchStats()
+    expected = path_indices(get_solver("a-star")(maze, start, goal, a_star_stats))
+    found = path_indices(get_solver("jump-point")(maze, start, goal, jump_point_stats))
+    assert len(found) == len(expected) == 79
+    assert is_walk(maze, found)
+    assert jump_point_stats.expanded < a_star_stats.expanded
+
+@pytest.mark.parametrize("generator", ["dfs", "kruskal"])
+def test_fringe_lengths_match_bfs(generator):
+    bfs, fringe = get_solver("bfs"), get_solver("fringe")
+    maze = with_loops(generate(25, 20, seed=10, generator=generator), count=120, seed=10)
+    for start, goal in random_pairs(maze, 40, seed=10):
+        stats = SearchStats()
+        expected = path_indices(bfs(maze, start, goal))
+        found = path_indices(fringe(maze, start, goal, stats))
+        assert len(found) == len(expected)
+        assert is_walk(maze, found)
+        assert stats.heap_pushes == 0 and stats.iterations >= 1
+
+def test_bellman_ford_lengths_match_bfs():
+    bfs, bellman_ford = get_solver("bfs"), get_solver("bellman-ford")
+    maze = with_loops(generate(20, 15, seed=16), count=80, seed=16)
+    for start, goal in random_pairs(maze, 20, seed=16):
+        expected = path_indices(bfs(maze, start, goal))
+        found = path_indices(bellman_ford(maze, start, goal))
+        assert len(found) == len(expected)
+        assert is_walk(maze, found)
+
+def test_bellman_ford_relaxes_each_square_once_in_a_perfect_maze():
+    maze = generate(30, 30, seed=16)
+    stats = SearchStats()
+    get_solver("bellman-ford")(maze, maze.entrance, maze.exit, stats)
+    assert stats.expanded == len(maze.squares)
+
+def test_iddfs_lengths_match_bfs_on_small_looped_mazes():
+    bfs, iddfs = get_solver("bfs"), get_solver("iddfs")
+    maze = with_loops(generate(8, 7, seed=17), count=12, seed=17)
+    for start, goal in random_pairs(maze, 20, seed=17):
+        expected = path_indices(bfs(maze, start, goal))
+        found = path_indices(iddfs(maze, start, goal))
+        assert len(found) == len(expected)
+        assert found[0] == goal.index and found[-1] == start.index
+        assert is_walk(maze, found)
+
+def test_iddfs_follows_long_paths_without_recursion():
+    maze = generate(80, 80, seed=17)
+    stats = SearchStats()
+    expected = path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+    found = path_indices(get_solver("iddfs")(maze, maze.entrance, maze.exit, stats))
+    assert len(expected) > sys.getrecursionlimit() // 2
+    assert found == expected
+    assert stats.iterations <= (len(expected) - 1).bit_length() + 1
+    boxed = Maze(2, 1, array.array("B", [0xf, 0xf]))
+    assert get_solver("iddfs")(boxed, boxed.squares[0], boxed.squares[1]) is None
+
+def test_recursive_backtracking_finds_simple_paths():
+    solver = get_solver("recursive-bt")
+    maze = with_loops(generate(25, 20, seed=18), count=100, seed=18)
+    for start, goal in random_pairs(maze, 30, seed=18):
+        stats = SearchStats()
+        found = path_indices(solver(maze, start, goal, stats))
+        assert found[0] == goal.index and found[-1] == start.index
+        assert len(set(found)) == len(found)
+        assert is_walk(maze, found)
+        assert stats.expanded <= len(maze.squares)
+
+def test_recursive_backtracking_matches_bfs_in_perfect_mazes():
+    maze = generate(100, 100, seed=18)
+    expected = path_indices(get_solver("bfs")(maze, maze.entrance, maze.exit))
+    assert path_indices(get_solver("recursive-bt")(maze, maze.entrance, maze.exit)) == expected
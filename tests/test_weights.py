@@ -0,0 +1,49 @@
+# test_weights.py
+import functools
+import random
+
+import pytest
+
+from maze_solver.graphs.registry import eligible_solvers, get_solver
+from maze_solver.graphs.weights import square_costs, weighted_maze
+from maze_solver.models.role import Role
+
+from mazes import generate, is_walk, path_cost, path_indices, with_loops, with_roles
+
+WEIGHTED_SOLVERS = [info.name for info in eligible_solvers(optimal=True, weighted=True)]
+
+@functools.lru_cache(maxsize=None)
+def role_maze(seed: int):
+    return with_roles(with_loops(generate(15, 15, seed), 40, seed), rewards=25, enemies=15, seed=seed)
+
+def test_square_costs_follow_roles():
+    maze = role_maze(0)
+    costs = square_costs(maze, bonus=1, penalty=2)
+    for index, value in enumerate(maze.square_values):
+        expected = {Role.REWARD: 0, Role.ENEMY: 3}.get(value >> 4, 1)
+        assert costs[index] == expected
+
+@pytest.mark.parametrize("weights", [(1, 2), (0, 2), (1, 0)])
+@pytest.mark.parametrize("name", WEIGHTED_SOLVERS)
+def test_weighted_cost_matches_dijkstra(name, weights):
+    dijkstra, solver = get_solver("dijkstra"), get_solver(name)
+    for seed in range(40):
+        maze = role_maze(seed)
+        weighted = weighted_maze(maze, *weights)
+        rng = random.Random(seed)
+        squares = maze.squares
+        pairs = [(maze.entrance, maze.exit)] + [
+            (squares[rng.randrange(len(squares))], squares[rng.randrange(len(squares))]) for _ in range(10)
+        ]
+        for start, goal in pairs:
+            expected = path_indices(dijkstra(weighted, start, goal))
+            indices = path_indices(solver(weighted, start, goal))
+            assert indices[0] == goal.index and indices[-1] == start.index
+            assert is_walk(maze, indices)
+            assert path_cost(weighted, indices) == path_cost(weighted, expected)
+
+@pytest.mark.parametrize("name", ["bellman-ford", "dial"])
+def test_large_bonus_is_an_error(name):
+    maze = role_maze(0)
+    with pytest.raises(ValueError):
+        get_solver(name)(weighted_maze(maze, 3, 2), maze.entrance, maze.exit)